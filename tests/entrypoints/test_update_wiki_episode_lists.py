@@ -0,0 +1,117 @@
+from unittest.mock import MagicMock
+
+import pytest
+from mwparserfromhell.utils import parse_anything as parse_wiki
+
+from transcription_bot.entrypoints import update_wiki_episode_lists
+from transcription_bot.models.data_models import PodcastRssEntry, SguListEntry
+from transcription_bot.models.simple_models import EpisodeStatus
+
+TEST_DATE = "01-01"
+TEST_OTHER = "[[SGU Episode 0#quickie|Quickie]]"
+TEST_THEME = "[[SGU Episode 0#theme|Theme]]"
+TEST_INTERVIEWEE = "[[SGU Episode 0#interview|Someone]]"
+
+
+@pytest.fixture(name="create_or_update_episode_entry")
+def mock_create_or_update_episode_entry(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    mock = MagicMock()
+    monkeypatch.setattr(update_wiki_episode_lists, "create_or_update_episode_entry", mock)
+    return mock
+
+
+def _patch_entries(monkeypatch: pytest.MonkeyPatch, current: SguListEntry | None, expected: SguListEntry) -> MagicMock:
+    basic = SguListEntry(expected.episode, expected.date, expected.status)
+    add_segment_data_mock = MagicMock(return_value=expected)
+
+    monkeypatch.setattr(update_wiki_episode_lists, "get_episode_entry_from_list", MagicMock(return_value=current))
+    monkeypatch.setattr(update_wiki_episode_lists, "create_basic_episode_entry", MagicMock(return_value=basic))
+    monkeypatch.setattr(update_wiki_episode_lists, "add_segment_data_to_entry", add_segment_data_mock)
+
+    return add_segment_data_mock
+
+
+def test_process_episode_skips_up_to_date_entry(
+    podcast_rss_entry: PodcastRssEntry, create_or_update_episode_entry: MagicMock, monkeypatch: pytest.MonkeyPatch
+):
+    # Arrange
+    current = SguListEntry("0", TEST_DATE, EpisodeStatus.OPEN, other=TEST_OTHER)
+    expected = SguListEntry("0", TEST_DATE, EpisodeStatus.OPEN, other="n")
+    _patch_entries(monkeypatch, current, expected)
+
+    # Act
+    result = update_wiki_episode_lists.process_episode(podcast_rss_entry, MagicMock(), MagicMock())
+
+    # Assert
+    assert result is False
+    create_or_update_episode_entry.assert_not_called()
+
+
+def test_process_episode_updates_changed_entry(
+    podcast_rss_entry: PodcastRssEntry, create_or_update_episode_entry: MagicMock, monkeypatch: pytest.MonkeyPatch
+):
+    # Arrange
+    current = SguListEntry("0", TEST_DATE, EpisodeStatus.OPEN, other=TEST_OTHER)
+    expected = SguListEntry("0", TEST_DATE, EpisodeStatus.BOT, other="n")
+    _patch_entries(monkeypatch, current, expected)
+
+    # Act
+    result = update_wiki_episode_lists.process_episode(podcast_rss_entry, MagicMock(), MagicMock())
+
+    # Assert
+    assert result is True
+    create_or_update_episode_entry.assert_called_once()
+
+
+def test_process_episode_skips_segment_data_when_entry_is_complete(
+    podcast_rss_entry: PodcastRssEntry, create_or_update_episode_entry: MagicMock, monkeypatch: pytest.MonkeyPatch
+):
+    # Arrange
+    current = SguListEntry(
+        "0", TEST_DATE, EpisodeStatus.OPEN, other=TEST_OTHER, theme=TEST_THEME, interviewee=TEST_INTERVIEWEE
+    )
+    expected = SguListEntry("0", TEST_DATE, EpisodeStatus.OPEN)
+    add_segment_data_mock = _patch_entries(monkeypatch, current, expected)
+
+    # Act
+    result = update_wiki_episode_lists.process_episode(podcast_rss_entry, MagicMock(), MagicMock())
+
+    # Assert
+    assert result is False
+    add_segment_data_mock.assert_not_called()
+    create_or_update_episode_entry.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "page_text, expected_status",
+    [
+        ("{{Editing required|transcription = y}}\n{{transcription-bot}}", EpisodeStatus.BOT),
+        ("{{InfoBox|episodeNum = 1}}\n{{Editing required|transcription = y}}", EpisodeStatus.OPEN),
+        ("{{Editing required|transcription = |proofreading = y}}", EpisodeStatus.PROOFREAD),
+        ("{{Editing required|links = y}}", EpisodeStatus.UNKNOWN),
+        ("{{InfoBox|episodeNum = 1}}", EpisodeStatus.UNKNOWN),
+    ],
+)
+def test_get_episode_status(page_text: str, expected_status: EpisodeStatus):
+    # Act
+    status = update_wiki_episode_lists.get_episode_status(parse_wiki(page_text))
+
+    # Assert
+    assert status == expected_status
+
+
+def test_create_or_update_episode_entry_accumulates_edits_on_one_page():
+    # Arrange
+    episode_list = parse_wiki(f"{{{{{SguListEntry.identifier}|episode = 1|date = 01-01|status = open}}}}")
+    new_entries = [
+        SguListEntry("2", "01-08", EpisodeStatus.BOT, other="n"),
+        SguListEntry("3", "01-15", EpisodeStatus.BOT, other="n"),
+    ]
+
+    # Act
+    results = [update_wiki_episode_lists.create_or_update_episode_entry(episode_list, entry) for entry in new_entries]
+
+    # Assert
+    assert results == [True, True]
+    episodes = [str(t.get("episode").value).strip() for t in episode_list.filter_templates()]
+    assert episodes == ["3", "2", "1"]
@@ -93,6 +93,16 @@ def test_get_transcript_between_times_from_start(diarized_transcript: DiarizedTr
     assert result[0]["text"] == HOST_LINE_1
 
 
+def test_get_transcript_between_times_with_end_before_start(diarized_transcript: DiarizedTranscript):
+    # Act
+    result = episode_data_handler.get_transcript_between_times(
+        diarized_transcript, HOST_LINE_2_START_TIME, HOST_LINE_1_START_TIME
+    )
+
+    # Assert
+    assert result == []
+
+
 def test_get_partial_transcript_for_start_time_with_skip(diarized_transcript: DiarizedTranscript):
     # Act
     result = episode_data_handler.get_partial_transcript_for_start_time(
@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from transcription_bot.handlers import episode_segment_handler
+from transcription_bot.models.episode_segments import LogicalFallacySegment, RawSegments
+
+TEST_TOPIC = "Test Topic"
+
+
+@pytest.fixture(name="logger")
+def mock_logger(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    mock = MagicMock()
+    monkeypatch.setattr(episode_segment_handler, "logger", mock)
+    return mock
+
+
+def test_merge_segments_logs_duplicates(logger: MagicMock):
+    # Arrange
+    segments = RawSegments(
+        [
+            LogicalFallacySegment(title="Name That Logical Fallacy", topic=TEST_TOPIC),
+            LogicalFallacySegment(title="Name That Logical Fallacy", topic=TEST_TOPIC),
+            LogicalFallacySegment(title="Name That Logical Fallacy", topic="Other Topic"),
+        ]
+    )
+
+    # Act
+    episode_segment_handler.merge_segments(segments, RawSegments([]), RawSegments([]))
+
+    # Assert
+    logger.error.assert_called_once()
+
+
+def test_merge_segments_checks_each_collection_for_duplicates_separately(logger: MagicMock):
+    # Arrange
+    segment = LogicalFallacySegment(title="Name That Logical Fallacy", topic=TEST_TOPIC)
+
+    # Act
+    episode_segment_handler.merge_segments(RawSegments([segment]), RawSegments([segment]), RawSegments([segment]))
+
+    # Assert
+    logger.error.assert_not_called()
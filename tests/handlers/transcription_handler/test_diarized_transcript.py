@@ -0,0 +1,65 @@
+import pandas as pd
+
+from transcription_bot.handlers.transcription_handler._diarized_transcript import merge_transcript_and_diarization
+from transcription_bot.models.simple_models import RawTranscript
+
+
+def _create_diarization() -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {"start": 0.0, "end": 4.0, "speaker": "SPEAKER_00"},
+            {"start": 4.0, "end": 9.0, "speaker": "Steve"},
+            {"start": 9.0, "end": 12.0, "speaker": "Bob"},
+            {"start": 12.0, "end": 14.0, "speaker": "Steve"},
+        ]
+    )
+
+
+def test_merge_transcript_and_diarization_picks_most_active_speaker():
+    # Arrange
+    transcription: RawTranscript = [
+        {"start": 0.0, "end": 4.0, "text": "Intro"},
+        {"start": 7.0, "end": 14.0, "text": "Steve speaks longest in total"},
+        {"start": 14.0, "end": 15.0, "text": "Nobody is speaking"},
+    ]
+
+    # Act
+    result = merge_transcript_and_diarization(transcription, _create_diarization())
+
+    # Assert
+    assert [chunk["speaker"] for chunk in result] == ["Voice-over", "Steve", "UNKNOWN"]
+    assert [chunk["text"] for chunk in result] == ["Intro", "Steve speaks longest in total", "Nobody is speaking"]
+
+
+def test_merge_transcript_and_diarization_does_not_modify_diarization():
+    # Arrange
+    diarization = _create_diarization()
+    transcription: RawTranscript = [{"start": 0.0, "end": 4.0, "text": "Intro"}]
+
+    # Act
+    merge_transcript_and_diarization(transcription, diarization)
+
+    # Assert
+    assert list(diarization.columns) == ["start", "end", "speaker"]
+
+
+def test_merge_transcript_and_diarization_with_unsorted_overlapping_turns():
+    # Arrange
+    diarization = pd.DataFrame(
+        [
+            {"start": 10.0, "end": 20.0, "speaker": "Bob"},
+            {"start": 12.0, "end": 13.0, "speaker": "Jay"},
+            {"start": 0.0, "end": 15.0, "speaker": "Steve"},
+        ]
+    )
+    transcription: RawTranscript = [
+        {"start": 0.0, "end": 9.0, "text": "Steve alone"},
+        {"start": 12.0, "end": 16.0, "text": "Everyone at once"},
+        {"start": 16.0, "end": 19.0, "text": "Bob alone"},
+    ]
+
+    # Act
+    result = merge_transcript_and_diarization(transcription, diarization)
+
+    # Assert
+    assert [chunk["speaker"] for chunk in result] == ["Steve", "Bob", "Bob"]
@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from transcription_bot.handlers.transcription_handler import _transcription
+
+TEST_FILES_URL = "https://example.com/files"
+
+
+def test_wait_for_transcription_completion_backs_off(monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    statuses = ["Running", "Running", "Running", "Succeeded"]
+    responses = [
+        MagicMock(json=MagicMock(return_value={"status": s, "links": {"files": TEST_FILES_URL}})) for s in statuses
+    ]
+    monkeypatch.setattr(_transcription, "_session", MagicMock(get=MagicMock(side_effect=responses)))
+    sleep_mock = MagicMock()
+    monkeypatch.setattr(_transcription.time, "sleep", sleep_mock)
+    monkeypatch.setattr(_transcription.random, "uniform", MagicMock(return_value=1))
+
+    # Act
+    result = _transcription.wait_for_transcription_completion("https://example.com/transcription")
+
+    # Assert
+    assert result == TEST_FILES_URL
+    assert [call.args[0] for call in sleep_mock.call_args_list] == [2, 4, 8]
+
+
+def test_wait_for_transcription_completion_raises_on_failure(monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    response = MagicMock(json=MagicMock(return_value={"status": "Failed"}))
+    monkeypatch.setattr(_transcription, "_session", MagicMock(get=MagicMock(return_value=response)))
+
+    # Act/Assert
+    with pytest.raises(RuntimeError, match="Transcription failed"):
+        _transcription.wait_for_transcription_completion("https://example.com/transcription")
+
+
+def test_wait_for_transcription_completion_caps_the_delay(monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    statuses = ["Running"] * 7 + ["Succeeded"]
+    responses = [
+        MagicMock(json=MagicMock(return_value={"status": s, "links": {"files": TEST_FILES_URL}})) for s in statuses
+    ]
+    monkeypatch.setattr(_transcription, "_session", MagicMock(get=MagicMock(side_effect=responses)))
+    sleep_mock = MagicMock()
+    monkeypatch.setattr(_transcription.time, "sleep", sleep_mock)
+    monkeypatch.setattr(_transcription.random, "uniform", MagicMock(return_value=1))
+
+    # Act
+    _transcription.wait_for_transcription_completion("https://example.com/transcription")
+
+    # Assert
+    assert [call.args[0] for call in sleep_mock.call_args_list] == [2, 4, 8, 16, 32, 60, 60]
@@ -0,0 +1,66 @@
+import json
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from transcription_bot.interfaces import azure
+
+TEST_CONTENT_URL = "https://example.com/content"
+TICKS_PER_SECOND = 10_000_000
+
+
+def _create_phrase(offset_seconds: int, duration_seconds: int, display: str | None) -> dict[str, Any]:
+    return {
+        "offsetInTicks": offset_seconds * TICKS_PER_SECOND,
+        "durationInTicks": duration_seconds * TICKS_PER_SECOND,
+        "nBest": [{"display": display}] if display is not None else [],
+    }
+
+
+def test_get_transcription_results_skips_phrases_without_text(monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    raw_transcription = {
+        "recognizedPhrases": [
+            _create_phrase(0, 2, "Hello, Kara."),
+            _create_phrase(2, 1, ""),
+            _create_phrase(3, 1, None),
+            _create_phrase(4, 3, "Goodbye."),
+        ]
+    }
+    session_mock = MagicMock()
+    session_mock.get.return_value.json.return_value = {
+        "values": [{"kind": "Transcription", "links": {"contentUrl": TEST_CONTENT_URL}}]
+    }
+    monkeypatch.setattr(azure, "_session", session_mock)
+    download_file_mock = MagicMock(return_value=json.dumps(raw_transcription).encode())
+    monkeypatch.setattr(azure, "download_file", download_file_mock)
+
+    # Act
+    result = azure.get_transcription_results("https://example.com/files")
+
+    # Assert
+    assert result == [
+        {"start": 0.0, "end": 2.0, "text": "Hello, Cara."},
+        {"start": 4.0, "end": 7.0, "text": "Goodbye."},
+    ]
+    download_file_mock.assert_called_once_with(TEST_CONTENT_URL, session_mock)
+
+
+def test_iter_transcriptions_follows_next_links(monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    pages = [
+        {"values": [{"id": 1}, {"id": 2}], "@nextLink": "https://example.com/page2"},
+        {"values": [{"id": 3}]},
+    ]
+    session_mock = MagicMock()
+    session_mock.get.return_value.json.side_effect = pages
+    monkeypatch.setattr(azure, "_session", session_mock)
+
+    # Act
+    result = azure.get_all_transcriptions()
+
+    # Assert
+    assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert session_mock.get.call_count == 2
+    assert session_mock.get.call_args.args[0] == "https://example.com/page2"
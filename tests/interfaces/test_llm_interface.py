@@ -1,11 +1,16 @@
+# The shared client is module state; only the private _get_openai_client cache can reset it between tests.
+# pyright: reportPrivateUsage=false
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from transcription_bot.interfaces import llm_interface
 from transcription_bot.models.episode_segments import BaseSegment
 from transcription_bot.models.simple_models import DiarizedTranscript
 
 TEST_LLM_RESULT = 42.0
+TEST_IMAGE_CAPTION = "A test caption"
 
 
 def test_cache_llm(tmp_path: Path, segment: MagicMock, transcript: MagicMock):
@@ -30,3 +35,24 @@ def test_cache_llm(tmp_path: Path, segment: MagicMock, transcript: MagicMock):
         assert result2 == result1
         # Verify the underlying function was only called once
         llm_mock.assert_called_once_with(episode_num, segment, transcript)
+
+
+def test_llm_calls_share_one_openai_client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    response = MagicMock()
+    response.choices[0].message.content = TEST_IMAGE_CAPTION
+    openai_mock = MagicMock()
+    openai_mock.return_value.chat.completions.create.return_value = response
+    monkeypatch.setattr(llm_interface, "OpenAI", openai_mock)
+    llm_interface._get_openai_client.cache_clear()
+
+    with patch("transcription_bot.utils.caching._CACHE_FOLDER", tmp_path):
+        # Act
+        caption1 = llm_interface.get_image_caption_from_llm("https://example.com/image1.jpg")
+        caption2 = llm_interface.get_image_caption_from_llm("https://example.com/image2.jpg")
+
+    # Assert
+    assert caption1 == caption2 == TEST_IMAGE_CAPTION
+    openai_mock.assert_called_once()
+    assert openai_mock.return_value.chat.completions.create.call_count == 2
+    llm_interface._get_openai_client.cache_clear()
@@ -2,14 +2,17 @@ from http.client import NOT_FOUND
 from unittest.mock import MagicMock, create_autospec, patch
 
 import pytest
+from mwparserfromhell.utils import parse_anything as parse_wiki
 
 from transcription_bot.interfaces import wiki
+from transcription_bot.models.data_models import SguListEntry
 from transcription_bot.utils.global_http_client import HttpClient
 
 # Test constants
 TEST_EPISODE_NUMBER = "123"
 TEST_LOGIN_TOKEN = "test_login_token"  # noqa: S105
 TEST_CSRF_TOKEN = "test_csrf_token"  # noqa: S105
+CSRF_TOKEN_TTL = 30 * 60
 TEST_QUOTE = "Test quote"
 TEST_ATTRIBUTION = "Test attribution"
 TEST_WIKI_TEXT = "Quote segment wiki text"
@@ -41,6 +44,33 @@ def test_log_into_wiki(http_client: MagicMock):
     assert http_client.post.call_count == 1  # Send credentials
 
 
+def test_log_into_wiki_reuses_token(http_client: MagicMock):
+    # Arrange
+    wiki.log_into_wiki(http_client)
+
+    # Act
+    csrf_token = wiki.log_into_wiki(http_client)
+
+    # Assert
+    assert csrf_token == TEST_CSRF_TOKEN
+    assert http_client.get.call_count == 2
+    assert http_client.post.call_count == 1
+
+
+def test_log_into_wiki_refreshes_expired_token(http_client: MagicMock, monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    wiki.log_into_wiki(http_client)
+    expired_time = wiki.time.monotonic() + CSRF_TOKEN_TTL
+    monkeypatch.setattr(wiki.time, "monotonic", MagicMock(return_value=expired_time))
+
+    # Act
+    wiki.log_into_wiki(http_client)
+
+    # Assert
+    assert http_client.get.call_count == 4
+    assert http_client.post.call_count == 2
+
+
 def test_episode_has_wiki_page_exists(http_client: MagicMock):
     # Arrange
     http_client.get.return_value.status_code = 200
@@ -78,3 +108,41 @@ def test_save_wiki_page(http_client: MagicMock):
         _, kwargs = http_client.post.call_args
         assert kwargs["data"]["title"] == TEST_PAGE_TITLE
         assert kwargs["data"]["text"] == TEST_PAGE_CONTENT
+
+
+@pytest.mark.parametrize(
+    "episode_value, expected_found",
+    [
+        (TEST_EPISODE_NUMBER, True),
+        (f"<!-- note -->{TEST_EPISODE_NUMBER}", True),
+        ("1<!-- note -->23", True),
+        ("1<nowiki/>23", True),
+        (f"{TEST_EPISODE_NUMBER}4", False),
+        ("12", False),
+    ],
+)
+def test_get_episode_template_from_list(episode_value: str, *, expected_found: bool):
+    # Arrange
+    identifier = SguListEntry.identifier
+    episode_list_page = parse_wiki(
+        f"{{{{{identifier}|episode = 1|date = 01-01}}}}\n{{{{{identifier}|episode = {episode_value}|date = 01-08}}}}"
+    )
+
+    # Act
+    template = wiki.get_episode_template_from_list(episode_list_page, TEST_EPISODE_NUMBER)
+
+    # Assert
+    assert (template is not None) is expected_found
+
+
+def test_get_episode_wiki_pages(monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    get_wiki_page_mock = MagicMock(side_effect=parse_wiki)
+    monkeypatch.setattr(wiki, "get_wiki_page", get_wiki_page_mock)
+
+    # Act
+    pages = wiki.get_episode_wiki_pages([1, 2, 1])
+
+    # Assert
+    assert {number: str(page) for number, page in pages.items()} == {1: "SGU_Episode_1", 2: "SGU_Episode_2"}
+    assert get_wiki_page_mock.call_count == 2
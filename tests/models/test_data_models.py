@@ -1,5 +1,7 @@
 from datetime import date
 
+from mwparserfromhell.nodes import Template
+
 from transcription_bot.models import data_models
 from transcription_bot.models.simple_models import EpisodeStatus
 
@@ -17,3 +19,28 @@ def test_create_podcast_rss_entry():
     data_models.PodcastRssEntry(
         0, "fake_title", "fake_summary", "fake_download_url", "fake_episode_url", date(2000, 1, 1)
     )
+
+
+def test_podcast_rss_entry_month_day():
+    # Arrange
+    entry = data_models.PodcastRssEntry(
+        0, "fake_title", "fake_summary", "fake_download_url", "fake_episode_url", date(2000, 3, 7)
+    )
+
+    # Act/Assert
+    assert entry.month_day == "03-07"
+
+
+def test_sgu_list_entry_update_template_reports_changes():
+    # Arrange
+    entry = data_models.SguListEntry("1", "01-01", EpisodeStatus.OPEN, other="n")
+    template = Template(data_models.SguListEntry.identifier)
+
+    # Act
+    first_update = entry.update_template(template)
+    second_update = entry.update_template(template)
+
+    # Assert
+    assert first_update is True
+    assert second_update is False
+    assert data_models.SguListEntry.from_template(template) == entry
@@ -1,3 +1,11 @@
+# The keyword search caches are only observable through the private _lowercase and _prepare_keywords helpers.
+# pyright: reportPrivateUsage=false
+
+from unittest.mock import MagicMock
+
+import pytest
+from bs4 import BeautifulSoup, Tag
+
 from transcription_bot.models import episode_segments
 from transcription_bot.models.simple_models import DiarizedTranscript
 
@@ -13,6 +21,7 @@ TEST_ATTRIBUTION = "John Doe"
 
 def test_format_time():
     assert episode_segments.format_time(None) == "???"
+    assert episode_segments.format_time(0.0) == "00:00"
     assert episode_segments.format_time(0.1) == "00:00"
     assert episode_segments.format_time(61.0) == "01:01"
     assert episode_segments.format_time(3661.0) == "1:01:01"
@@ -33,6 +42,24 @@ def test_format_transcript_for_wiki():
     assert "'''B:''' Welcome to the show" in formatted
 
 
+def test_format_transcript_for_wiki_joins_speaker_chunks_without_modifying_transcript():
+    # Arrange
+    diarized_transcript: DiarizedTranscript = [
+        {"speaker": "Steve", "text": " Hello ", "start": 0.0, "end": 1.0},
+        {"speaker": "Steve", "text": "everyone", "start": 1.0, "end": 2.0},
+        {"speaker": "SPEAKER_03", "text": "Hi", "start": 2.0, "end": 3.0},
+        {"speaker": "Voice-over", "text": "Music", "start": 3.0, "end": 4.0},
+    ]
+    original = [chunk.copy() for chunk in diarized_transcript]
+
+    # Act
+    formatted = episode_segments.format_transcript_for_wiki(diarized_transcript)
+
+    # Assert
+    assert formatted == "'''S:''' Hello everyone\n\n'''US#03:''' Hi\n\n'''Voice-over:''' Music"
+    assert diarized_transcript == original
+
+
 def test_unknown_segment():
     # Arrange
     test_title = "Test Title"
@@ -219,3 +246,199 @@ def test_swindlers_list_segment():
 
     # Assert
     assert segment.topic == "N/A<!-- Failed to extract topic -->"
+
+
+def test_outro_segment_get_start_time():
+    # Arrange
+    transcript: DiarizedTranscript = [
+        {"speaker": "Steve", "text": "Until next week", "start": 0.0, "end": 2.0},
+        {
+            "speaker": "Steve",
+            "text": "The Skeptics' Guide to the Universe is produced by SGU Productions",
+            "start": 2.0,
+            "end": 4.0,
+        },
+    ]
+
+    # Act
+    start_time = episode_segments.OutroSegment().get_start_time(transcript)
+
+    # Assert
+    assert start_time == 2.0
+
+
+def test_quickie_segment_get_start_time_checks_each_chunk_for_either_keyword_set():
+    # Arrange
+    segment = episode_segments.QuickieSegment(title="Quickie with Bob", subject="glowing fungi", url=TEST_ARTICLE_URL)
+    transcript: DiarizedTranscript = [
+        {"speaker": "Bob", "text": "Some glowing fungi today", "start": 0.0, "end": 2.0},
+        {"speaker": "Steve", "text": "Quickie with Bob", "start": 2.0, "end": 4.0},
+    ]
+
+    # Act
+    start_time = segment.get_start_time(transcript)
+
+    # Assert
+    assert start_time == 0.0
+
+
+def test_get_matching_segment_types():
+    # Act
+    matching_types = episode_segments.get_matching_segment_types("quickie with bob: glowing fungi")
+
+    # Assert
+    assert matching_types == [episode_segments.QuickieSegment]
+
+
+def test_get_start_time_matches_keyword_substrings():
+    # Arrange
+    segment = episode_segments.ForgottenSuperheroesOfScienceSegment()
+    transcript: DiarizedTranscript = [
+        {"speaker": "Steve", "text": "Let's talk about heroes", "start": 0.0, "end": 2.0},
+        {"speaker": "Steve", "text": "Forgotten Superheroes of Science", "start": 2.0, "end": 4.0},
+    ]
+
+    # Act
+    start_time = segment.get_start_time(transcript)
+
+    # Assert
+    assert start_time == 2.0
+
+
+def test_get_start_time_lowercases_each_chunk_once_across_segments():
+    # Arrange
+    transcript: DiarizedTranscript = [
+        {"speaker": "Steve", "text": "Welcome to the show", "start": 0.0, "end": 2.0},
+        {"speaker": "Steve", "text": "It's time for Science or Fiction", "start": 2.0, "end": 4.0},
+    ]
+    segments = [episode_segments.OutroSegment(), episode_segments.ScienceOrFictionSegment(raw_items=[], theme=None)]
+    episode_segments._lowercase.cache_clear()
+
+    # Act
+    for segment in segments:
+        segment.get_start_time(transcript)
+
+    # Assert
+    cache_info = episode_segments._lowercase.cache_info()
+    assert cache_info.misses == len(transcript)
+    assert cache_info.hits > 0
+
+
+def test_news_meta_segment_from_lyrics():
+    # Arrange
+    text = f"News Items\nNews Item #1: First topic\n{TEST_ARTICLE_URL}\nNews Item #2: Second topic"
+
+    # Act
+    segment = episode_segments.NewsMetaSegment.from_lyrics(text)
+
+    # Assert
+    assert [(item.item_number, item.topic, item.url) for item in segment.news_segments] == [
+        (1, "First topic", TEST_ARTICLE_URL),
+        (2, "Second topic", None),
+    ]
+
+
+def test_get_start_time_with_empty_keyword_set_matches_short_chunks():
+    # Arrange
+    segment = episode_segments.UnknownSegment(title="Productions", extra_text="", url=None)
+    transcript: DiarizedTranscript = [{"speaker": "Bob", "text": "Yes", "start": 0.0, "end": 1.0}]
+
+    # Act
+    start_time = segment.get_start_time(transcript)
+
+    # Assert
+    assert start_time == 0.0
+
+
+def test_prepare_keywords_checks_longest_keywords_first_and_drops_contained_ones():
+    # Act
+    keywords = episode_segments._prepare_keywords(("sgu", "produced", "by", "productions", "product", "sgu"))
+
+    # Assert
+    assert keywords == ("productions", "produced", "sgu", "by")
+
+
+def test_unknown_segment_get_start_time_ignores_case_of_title_and_extra_text():
+    # Arrange
+    segment = episode_segments.UnknownSegment(title="Mystery Segment", extra_text="Ancient Aliens", url=None)
+    transcript: DiarizedTranscript = [
+        {"speaker": "Steve", "text": "Let's move on", "start": 0.0, "end": 2.0},
+        {"speaker": "Steve", "text": "Now, about those ancient aliens", "start": 2.0, "end": 4.0},
+    ]
+
+    # Act
+    start_time = segment.get_start_time(transcript)
+
+    # Assert
+    assert start_time == 2.0
+
+
+def test_interview_segment_from_show_notes():
+    # Arrange
+    header = BeautifulSoup("<h3>Interview WITH Keith Withers</h3>", "html.parser").h3
+    assert isinstance(header, Tag)
+    segment_data = [header]
+
+    # Act
+    segment = episode_segments.InterviewSegment.from_show_notes(segment_data)
+
+    # Assert
+    assert segment.name == "Keith Withers"
+
+
+def test_prefetch_article_titles(monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    get_article_title_mock = MagicMock(return_value=TEST_ARTICLE_TITLE)
+    monkeypatch.setattr(episode_segments, "get_article_title", get_article_title_mock)
+    sof_soup = BeautifulSoup(
+        f'<div><p><a href="{TEST_ARTICLE_URL}/sof">{TEST_ITEM_TEXT}</a></p></div><div><p>{TEST_ITEM_TEXT}</p></div>',
+        "html.parser",
+    )
+    sof_items: list[Tag] = sof_soup.find_all("div")
+    segments = [
+        episode_segments.NewsItem(item_number=1, topic=TEST_TOPIC, url=TEST_ARTICLE_URL),
+        episode_segments.NewsItem(item_number=2, topic=TEST_TOPIC, url=TEST_ARTICLE_URL),
+        episode_segments.NewsItem(item_number=3, topic=TEST_TOPIC, url=None),
+        episode_segments.InterviewSegment(name=TEST_ATTRIBUTION, url=f"{TEST_ARTICLE_URL}/interview"),
+        episode_segments.ScienceOrFictionSegment(raw_items=sof_items, theme=None),
+    ]
+
+    # Act
+    episode_segments.prefetch_article_titles(segments)
+
+    # Assert
+    assert sorted(call.args[0] for call in get_article_title_mock.call_args_list) == [
+        TEST_ARTICLE_URL,
+        f"{TEST_ARTICLE_URL}/sof",
+    ]
+
+
+def test_forgotten_superheroes_segment_from_summary_text():
+    # Act
+    segment = episode_segments.ForgottenSuperheroesOfScienceSegment.from_summary_text("\n  Jane Doe \nMore text")
+    empty_segment = episode_segments.ForgottenSuperheroesOfScienceSegment.from_summary_text(" \n ")
+
+    # Assert
+    assert segment.subject == "Jane Doe"
+    assert empty_segment.subject == ""
+
+
+def test_swindlers_list_segment_from_summary_text():
+    # Act
+    segment = episode_segments.SwindlersListSegment.from_summary_text("Swindler's List: Scams: a history")
+
+    # Assert
+    assert segment.topic == "Scams: a history"
+
+
+def test_label_values_keep_text_after_a_second_colon():
+    # Arrange
+    email_data: list[Tag] = [BeautifulSoup("<h3>Your Questions: Time: travel, Ghosts</h3>", "html.parser")]
+
+    # Act
+    sof_segment = episode_segments.ScienceOrFictionSegment.from_lyrics("Science or Fiction\nTheme: Space: the sequel")
+    email_segment = episode_segments.EmailSegment.from_show_notes(email_data)
+
+    # Assert
+    assert sof_segment.theme == "Space: the sequel"
+    assert email_segment.items == ["Time: travel", "Ghosts"]
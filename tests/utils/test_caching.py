@@ -84,3 +84,35 @@ def test_cache_for_episode_different_episodes(tmp_path: Path):
         assert test_func_mock.call_count == 2
         test_func_mock.assert_any_call(episode1)
         test_func_mock.assert_any_call(episode2)
+
+
+def test_cache_url_title_reads_cache_file_once(tmp_path: Path):
+    # Arrange
+    with patch("transcription_bot.utils.caching._CACHE_FOLDER", tmp_path):
+
+        @caching.cache_for_url
+        def get_title(url: str) -> str:
+            return f"Title for {url}"
+
+        get_title(TEST_URL)
+
+        # Act
+        with patch("transcription_bot.utils.caching.load_cache") as load_cache_mock:
+            result = get_title(TEST_URL)
+
+        # Assert
+        assert result == f"Title for {TEST_URL}"
+        load_cache_mock.assert_not_called()
+
+
+def test_save_cache_replaces_file_without_leaving_temp_file(tmp_path: Path):
+    # Arrange
+    cache_file = tmp_path / "1.json_or_pkl"
+    cache_file.write_text("stale")
+
+    # Act
+    caching.save_cache(cache_file, {TEST_DATA_KEY: TEST_DATA_VALUE})
+
+    # Assert
+    assert caching.load_cache(cache_file) == {TEST_DATA_KEY: TEST_DATA_VALUE}
+    assert [path.name for path in tmp_path.iterdir()] == [cache_file.name]
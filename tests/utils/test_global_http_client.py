@@ -0,0 +1,16 @@
+from transcription_bot.utils.global_http_client import HttpClient
+
+TEST_HEADER = {"Authorization": "Bearer token"}
+
+
+def test_with_auth_header_shares_connection_pools():
+    # Arrange
+    client = HttpClient()
+
+    # Act
+    auth_client = client.with_auth_header(TEST_HEADER)
+
+    # Assert
+    assert auth_client.headers["Authorization"] == TEST_HEADER["Authorization"]
+    assert "Authorization" not in client.headers
+    assert auth_client.get_adapter("https://example.com") is client.get_adapter("https://example.com")
@@ -0,0 +1,45 @@
+import pytest
+from bs4 import BeautifulSoup
+
+from transcription_bot.utils import helpers
+
+TEST_HTML = """
+<div>
+    <span class="science-fiction__item-title">Item #1</span>
+    <p>Some <a href="https://example.com">item</a></p>
+    <span class="quiz__answer other-class">Fiction</span>
+</div>
+"""
+
+
+def test_find_single_elements():
+    # Arrange
+    soup = BeautifulSoup(TEST_HTML, "html.parser")
+
+    # Act
+    title, paragraph, answer = helpers.find_single_elements(
+        soup, ("span", "science-fiction__item-title"), ("p", None), ("span", "quiz__answer")
+    )
+
+    # Assert
+    assert title.text == "Item #1"
+    assert paragraph.text == "Some item"
+    assert answer.text == "Fiction"
+
+
+def test_find_single_elements_requires_exactly_one_match():
+    # Arrange
+    soup = BeautifulSoup(TEST_HTML, "html.parser")
+
+    # Act/Assert
+    with pytest.raises(ValueError, match="<span class=None> elements extracted, expected 1, got 2"):
+        helpers.find_single_elements(soup, ("span", None))
+
+
+def test_find_single_element_names_the_missing_target():
+    # Arrange
+    soup = BeautifulSoup(TEST_HTML, "html.parser")
+
+    # Act/Assert
+    with pytest.raises(ValueError, match="<div class='thumbnail'> elements extracted, expected 1, got 0"):
+        helpers.find_single_element(soup, "div", "thumbnail")
@@ -19,8 +19,6 @@ from transcription_bot.utils.config import UNPROCESSABLE_EPISODES, config
 from transcription_bot.utils.global_http_client import http_client
 from transcription_bot.utils.helpers import run_main_safely, setup_tracing
 
-setup_tracing(config)
-
 
 @cronitor.job(config.cronitor_job_id)
 def main(*, selected_episode: int) -> None:
@@ -35,7 +33,12 @@ def main(*, selected_episode: int) -> None:
 
     if selected_episode:
         allow_page_editing = True
-        podcast_rss_entry = next(episode for episode in rss_entries if episode.episode_number == selected_episode)
+        rss_map = {episode.episode_number: episode for episode in rss_entries}
+
+        if selected_episode not in rss_map:
+            raise ValueError(f"Episode {selected_episode} was not found in the podcast RSS feed.")
+
+        podcast_rss_entry = rss_map[selected_episode]
     else:
         allow_page_editing = False
         podcast_rss_entry = rss_entries[0]
@@ -87,4 +90,5 @@ if __name__ == "__main__":
         else:
             _episode_to_process = int(_episodes_to_process[0])
 
+    setup_tracing(config)
     run_main_safely(main, selected_episode=_episode_to_process)
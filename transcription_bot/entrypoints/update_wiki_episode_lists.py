@@ -13,9 +13,9 @@ from transcription_bot.handlers.episode_raw_data_handler import gather_raw_data
 from transcription_bot.handlers.episode_segment_handler import extract_episode_segments_from_episode_raw_data
 from transcription_bot.interfaces.wiki import (
     get_episode_entry_from_list,
-    get_episode_list_wiki_page,
+    get_episode_list_wiki_pages,
     get_episode_template_from_list,
-    get_episode_wiki_page,
+    get_episode_wiki_pages,
     update_episode_list,
 )
 from transcription_bot.models.data_models import PodcastRssEntry, SguListEntry
@@ -37,7 +37,7 @@ from transcription_bot.utils.helpers import (
     setup_tracing,
 )
 
-setup_tracing(config)
+_STATUS_TEMPLATE_NAMES = frozenset(("transcription-bot", "Editing required"))
 
 
 @cronitor.job(config.cronitor_job_id)
@@ -56,49 +56,83 @@ def main(episode_numbers: set[int]) -> None:
 
     good_episode_numbers = filter_bad_episodes(episode_numbers)
 
+    if not good_episode_numbers:
+        logger.info("No processable episode pages found. Exiting.")
+        return
+
     logger.info("Getting episodes from podcast RSS feed...")
-    rss_map = {episode.episode_number: episode for episode in get_podcast_rss_entries(http_client)}
+    rss_entries = get_podcast_rss_entries(http_client, min_episode_number=min(good_episode_numbers))
+    rss_map = {episode.episode_number: episode for episode in rss_entries}
+
+    if missing_episode_numbers := set(good_episode_numbers).difference(rss_map):
+        raise ValueError(f"Episodes not found in the podcast RSS feed: {sorted(missing_episode_numbers)}")
 
     logger.info("Getting episode list pages...")
     episode_years = {episode_number: rss_map[episode_number].year for episode_number in good_episode_numbers}
-    episode_lists = {year: get_episode_list_wiki_page(year) for year in set(episode_years.values())}
+    episode_lists = get_episode_list_wiki_pages(episode_years.values())
+
+    logger.info("Getting episode pages...")
+    episode_pages = get_episode_wiki_pages(good_episode_numbers)
 
+    modified_years: set[int] = set()
     for episode_number in good_episode_numbers:
         logger.info(f"Processing episode #{episode_number}")
 
         episode_rss_entry = rss_map[episode_number]
 
         try:
-            process_episode(episode_rss_entry, episode_lists[episode_rss_entry.year])
+            if process_episode(episode_rss_entry, episode_lists[episode_rss_entry.year], episode_pages[episode_number]):
+                modified_years.add(episode_rss_entry.year)
         except ID3NoHeaderError:
             logger.error(f"Unable to process mp3 for episode {episode_number}")
         except NoLyricsTagError:
             logger.error(f"Cannot process episode {episode_number} due to missing lyrics tag.")
 
-    for year, episode_list in episode_lists.items():
-        update_episode_list(http_client, year, str(episode_list))
+    for year in sorted(modified_years):
+        update_episode_list(http_client, year, str(episode_lists[year]))
 
 
-def process_episode(episode_rss_entry: PodcastRssEntry, episode_list_page: Wikicode) -> None:
-    """Update the episode list based on the information about an episode."""
+def process_episode(episode_rss_entry: PodcastRssEntry, episode_list_page: Wikicode, episode_page: Wikicode) -> bool:
+    """Update the episode list based on the information about an episode.
+
+    Returns:
+        bool: True if the episode list was modified, False if the entry was already up to date.
+    """
     current_episode_entry = get_episode_entry_from_list(episode_list_page, str(episode_rss_entry.episode_number))
-    expected_episode_entry = create_expected_episode_entry(episode_rss_entry)
+    expected_episode_entry = create_basic_episode_entry(episode_rss_entry, episode_page)
+
+    # Values already in the list take priority when merging, so segment data is only needed to fill the gaps.
+    if not (current_episode_entry and current_episode_entry.has_segment_data):
+        expected_episode_entry = add_segment_data_to_entry(episode_rss_entry, expected_episode_entry)
 
     if current_episode_entry:
         expected_episode_entry = expected_episode_entry | current_episode_entry
 
+        if expected_episode_entry == current_episode_entry:
+            logger.info(f"Entry for episode {episode_rss_entry.episode_number} is up to date.")
+            return False
+
     logger.info("Updating episode entry...")
-    create_or_update_episode_entry(episode_list_page, expected_episode_entry)
+    if not create_or_update_episode_entry(episode_list_page, expected_episode_entry):
+        logger.info(f"Entry for episode {episode_rss_entry.episode_number} was already up to date.")
+        return False
+
     logger.info(f"Entry created/updated for episode {episode_rss_entry.episode_number}")
+    return True
 
 
-def create_expected_episode_entry(episode_rss_entry: PodcastRssEntry) -> SguListEntry:
-    """Construct an episode entry based on the contents of the episode page."""
+def create_basic_episode_entry(episode_rss_entry: PodcastRssEntry, episode_page: Wikicode) -> SguListEntry:
+    """Construct an episode entry with only the data that is cheap to obtain (no segment data)."""
     episode_number = episode_rss_entry.episode_number
-    episode_page = get_episode_wiki_page(episode_number)
-    date = episode_rss_entry.date.strftime("%m-%d")
     status = get_episode_status(episode_page)
 
+    return SguListEntry(str(episode_number), episode_rss_entry.month_day, status)
+
+
+def add_segment_data_to_entry(episode_rss_entry: PodcastRssEntry, entry: SguListEntry) -> SguListEntry:
+    """Return a copy of the entry that includes the data extracted from the episode segments."""
+    episode_number = episode_rss_entry.episode_number
+
     logger.debug("Gathering episode raw_data...")
     episode_raw_data = gather_raw_data(episode_rss_entry, http_client)
 
@@ -106,9 +140,9 @@ def create_expected_episode_entry(episode_rss_entry: PodcastRssEntry) -> SguList
     episode_segments = extract_episode_segments_from_episode_raw_data(episode_raw_data)
 
     return SguListEntry(
-        str(episode_number),
-        date,
-        status,
+        entry.episode,
+        entry.date,
+        entry.status,
         other=get_other_segments(episode_number, episode_segments),
         theme=get_sof_theme(episode_number, episode_segments),
         interviewee=get_interviewee(episode_number, episode_segments),
@@ -118,30 +152,35 @@ def create_expected_episode_entry(episode_rss_entry: PodcastRssEntry) -> SguList
 
 def get_episode_status(episode_page: Wikicode) -> EpisodeStatus:
     """Get the status of a transcript."""
-    templates: list[Template] = episode_page.filter_templates()
+    status_templates: dict[str, Template] = {}
+    for template in episode_page.ifilter_templates():
+        name = template.name.strip_code().strip()
+        if name in _STATUS_TEMPLATE_NAMES:
+            status_templates.setdefault(name, template)
 
-    for template in templates:
-        if template.name.strip_code().strip() == "transcription-bot":
-            return EpisodeStatus.BOT
+    if "transcription-bot" in status_templates:
+        return EpisodeStatus.BOT
 
-    for template in templates:
-        if template.name.strip_code().strip() == "Editing required":
-            if (
-                template.has("transcription")
-                and template.get("transcription").value.strip_code().strip().lower() == "y"
-            ):
-                return EpisodeStatus.OPEN
+    if editing_required := status_templates.get("Editing required"):
+        if _is_flag_set(editing_required, "transcription"):
+            return EpisodeStatus.OPEN
 
-            if template.has("proofreading") and template.get("proofreading").value.strip_code().strip().lower() == "y":
-                return EpisodeStatus.PROOFREAD
-
-            return EpisodeStatus.UNKNOWN
+        if _is_flag_set(editing_required, "proofreading"):
+            return EpisodeStatus.PROOFREAD
 
     return EpisodeStatus.UNKNOWN
 
 
-def create_or_update_episode_entry(episode_list: Wikicode, expected_entry: SguListEntry) -> None:
-    """Create or update the entry in the episode list."""
+def _is_flag_set(template: Template, param: str) -> bool:
+    return template.has(param, ignore_empty=True) and template.get(param).value.strip_code().strip().lower() == "y"
+
+
+def create_or_update_episode_entry(episode_list: Wikicode, expected_entry: SguListEntry) -> bool:
+    """Create or update the entry in the episode list.
+
+    Returns:
+        bool: True if the episode list was modified.
+    """
     template = get_episode_template_from_list(episode_list, expected_entry.episode)
 
     if template is None:
@@ -156,7 +195,7 @@ def create_or_update_episode_entry(episode_list: Wikicode, expected_entry: SguLi
         # We use insert_before to be higher on the list (later episodes first)
         episode_list.insert_before(previous_episode_template, template)
 
-    expected_entry.update_template(template)
+    return expected_entry.update_template(template)
 
 
 def get_other_segments(episode_number: int, segments: list[BaseSegment]) -> str:
@@ -191,4 +230,5 @@ def get_interviewee(episode_number: int, segments: list[BaseSegment]) -> str:
 
 if __name__ == "__main__":
     _episodes_to_process = set()
+    setup_tracing(config)
     run_main_safely(main, _episodes_to_process)
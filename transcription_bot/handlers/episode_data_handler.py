@@ -1,3 +1,4 @@
+import bisect
 import itertools
 
 from loguru import logger
@@ -14,7 +15,7 @@ from transcription_bot.models.episode_segments import (
     ScienceOrFictionSegment,
     TranscribedSegments,
 )
-from transcription_bot.models.simple_models import DiarizedTranscript
+from transcription_bot.models.simple_models import DiarizedTranscript, DiarizedTranscriptChunk
 
 _THIRTY_MINUTES = 30 * 60
 
@@ -36,6 +37,8 @@ def add_transcript_to_segments(
     episode_raw_data: EpisodeRawData, transcript: DiarizedTranscript, episode_segments: RawSegments
 ) -> TranscribedSegments:
     """Add the transcript to the episode segments."""
+    # The time range lookups below rely on the chunks being in chronological order.
+    transcript = sorted(transcript, key=_get_chunk_start)
     partial_transcript: DiarizedTranscript = []
     segments = TranscribedSegments([IntroSegment(start_time=0), *episode_segments, OutroSegment()])
 
@@ -90,8 +93,18 @@ def add_transcript_to_segments(
 
 
 def get_transcript_between_times(transcript: DiarizedTranscript, start: float, end: float) -> DiarizedTranscript:
-    """Get the transcript between two times."""
-    return [c for c in transcript if start <= c["start"] < end]
+    """Get the transcript between two times.
+
+    The transcript must be sorted by start time.
+    """
+    start_index = bisect.bisect_left(transcript, start, key=_get_chunk_start)
+    end_index = bisect.bisect_left(transcript, end, lo=start_index, key=_get_chunk_start)
+
+    return transcript[start_index:end_index]
+
+
+def _get_chunk_start(chunk: DiarizedTranscriptChunk) -> float:
+    return chunk["start"]
 
 
 def get_partial_transcript_for_start_time(
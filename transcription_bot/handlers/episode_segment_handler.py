@@ -47,11 +47,15 @@ def extract_episode_segments_from_episode_raw_data(episode_raw_data: EpisodeRawD
 
 def _find_duplicate_segments(*segment_collections: RawSegments) -> None:
     for segment_collection in segment_collections:
-        seen = []
+        # Segments are mutable (and so unhashable) dataclasses, but equal segments have equal reprs.
+        seen: set[str] = set()
 
         for segment in segment_collection:
-            if segment in seen:
+            segment_repr = repr(segment)
+            if segment_repr in seen:
                 logger.error(f"Found duplicate segment: {segment}")
+            else:
+                seen.add(segment_repr)
 
 
 def _flatten_news(lyric_segments: RawSegments) -> RawSegments:
@@ -1,4 +1,5 @@
 import json
+from functools import cache
 
 import pandas as pd
 from loguru import logger
@@ -34,10 +35,11 @@ def create_diarization(rss_entry: PodcastRssEntry) -> pd.DataFrame:
     return pd.DataFrame(raw_diarization["output"]["identification"])
 
 
-def get_voiceprints() -> list[dict[str, str]]:
+@cache
+def get_voiceprints() -> tuple[dict[str, str], ...]:
     voiceprint_map: dict[str, str] = json.loads(VOICEPRINT_FILE.read_text())
 
-    return [{"voiceprint": voiceprint, "label": name} for name, voiceprint in voiceprint_map.items()]
+    return tuple({"voiceprint": voiceprint, "label": name} for name, voiceprint in voiceprint_map.items())
 
 
 def send_diarization_request(listener_url: str, audio_file_url: str) -> None:
@@ -1,4 +1,5 @@
 import concurrent.futures
+import sys
 
 import numpy as np
 import pandas as pd
@@ -14,7 +15,7 @@ def get_diarized_transcript(rss_entry: PodcastRssEntry) -> DiarizedTranscript:
     """Create a transcript with the audio and podcast information."""
     logger.info("Getting diarized transcript...")
 
-    with concurrent.futures.ThreadPoolExecutor() as executor:
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
         transcription_future = executor.submit(create_transcription, rss_entry)
         diarization_future = executor.submit(create_diarization, rss_entry)
 
@@ -28,29 +29,45 @@ def merge_transcript_and_diarization(transcription: RawTranscript, diarization:
     logger.info("Merging transcript and diarization...")
     diarized_transcript: DiarizedTranscript = []
 
-    for seg in transcription:
-        if not seg["text"]:
-            continue
-
-        # Find active speakers during the segment
-        diarization["intersection"] = np.minimum(diarization["end"], seg["end"]) - np.maximum(
-            diarization["start"], seg["start"]
+    diarization = diarization.sort_values("start", kind="stable")
+    speaker_codes, speakers = pd.factorize(diarization["speaker"], sort=True)
+    diarization_starts = diarization["start"].to_numpy(dtype=float)
+    diarization_ends = diarization["end"].to_numpy(dtype=float)
+    # Turns can overlap, so the ends are only in order once we take the running maximum
+    diarization_max_ends = np.maximum.accumulate(diarization_ends)
+
+    segment_starts = np.fromiter((seg["start"] for seg in transcription), dtype=float, count=len(transcription))
+    segment_ends = np.fromiter((seg["end"] for seg in transcription), dtype=float, count=len(transcription))
+
+    # Only turns that start before a segment ends and end after it starts can overlap it
+    first_turns = np.searchsorted(diarization_max_ends, segment_starts, side="right")
+    last_turns = np.searchsorted(diarization_starts, segment_ends, side="left")
+
+    for seg, start, end, first, last in zip(
+        transcription, segment_starts, segment_ends, first_turns, last_turns, strict=True
+    ):
+        # Sum how long each speaker is active during the segment
+        intersections = np.minimum(diarization_ends[first:last], end) - np.maximum(
+            diarization_starts[first:last], start
+        )
+        speaker_durations = np.bincount(
+            speaker_codes[first:last], weights=np.clip(intersections, 0, None), minlength=len(speakers)
         )
-        segment_speakers = diarization[diarization["intersection"] > 0]
 
-        if len(segment_speakers) > 0:
+        if speaker_durations.any():
             # Select the most active speaker
-            segment_speaker = (
-                segment_speakers.groupby("speaker")["intersection"].sum().sort_values(ascending=False).index[0]  # pyright: ignore[reportCallIssue]
-            )
+            segment_speaker = speakers[speaker_durations.argmax()]
 
             if not isinstance(segment_speaker, str):
                 raise TypeError(f"Unexpected speaker type: {type(segment_speaker)}")
         else:
             segment_speaker = "UNKNOWN"
 
+        # Thousands of chunks share a handful of speaker labels, so keep one string object per label.
         diarized_transcript.append(
-            DiarizedTranscriptChunk(start=seg["start"], end=seg["end"], text=seg["text"], speaker=segment_speaker)
+            DiarizedTranscriptChunk(
+                start=seg["start"], end=seg["end"], text=seg["text"], speaker=sys.intern(segment_speaker)
+            )
         )
 
     adjust_transcript_for_voiceover(diarized_transcript)
@@ -1,3 +1,4 @@
+import random
 import time
 
 from loguru import logger
@@ -11,6 +12,8 @@ from transcription_bot.utils.global_http_client import http_client
 _AUTH_HEADER = {"Ocp-Apim-Subscription-Key": config.azure_subscription_key}
 
 _HTTP_TIMEOUT = 30
+_POLL_BASE_DELAY = 2
+_POLL_MAX_DELAY = 60
 
 
 _session = http_client.with_auth_header(_AUTH_HEADER)
@@ -26,6 +29,7 @@ def create_transcription(rss_entry: PodcastRssEntry) -> RawTranscript:
 def wait_for_transcription_completion(transcription_url: str) -> str:
     logger.info("Waiting for transcription to complete...")
 
+    attempt = 0
     while True:
         resp = _session.get(transcription_url, timeout=_HTTP_TIMEOUT)
 
@@ -39,7 +43,15 @@ def wait_for_transcription_completion(transcription_url: str) -> str:
         if status == "Failed":
             raise RuntimeError(f"Transcription failed. {resp_object}")
 
-        logger.info(f"Waiting 1 minute, status: {status}")
-        time.sleep(60)
+        delay = _get_poll_delay(attempt)
+        logger.info(f"Waiting {delay:.0f} seconds, status: {status}")
+        time.sleep(delay)
+        attempt += 1
 
     return resp_object["links"]["files"]
+
+
+def _get_poll_delay(attempt: int) -> float:
+    """Back off exponentially so short jobs are picked up quickly and long jobs are polled sparingly."""
+    delay = min(_POLL_MAX_DELAY, _POLL_BASE_DELAY * 2**attempt)
+    return delay * random.uniform(0.5, 1)  # noqa: S311
@@ -1,4 +1,5 @@
 import json
+from collections.abc import Iterator
 from typing import Any
 from urllib.parse import urlencode
 
@@ -24,6 +25,8 @@ _TRANSCRIPTION_CONFIG = {
 _AUTH_HEADER = {"Ocp-Apim-Subscription-Key": config.azure_subscription_key}
 _API_BASE_URL = f"https://{config.azure_service_region}.api.cognitive.microsoft.com"
 _TRANSCRIPTIONS_ENDPOINT = f"{_API_BASE_URL}/speechtotext/transcriptions"
+_SUBMIT_URL = f"{_TRANSCRIPTIONS_ENDPOINT}:submit"
+_LIST_URL = f"{_TRANSCRIPTIONS_ENDPOINT}?{urlencode(_API_VERSION_PARAM)}"
 
 
 # One tick is 100 nanoseconds
@@ -43,9 +46,7 @@ def send_transcription_request(rss_entry: PodcastRssEntry) -> str:
         "customProperties": {"episode_number": rss_entry.episode_number},
     }
 
-    resp = _session.post(
-        f"{_TRANSCRIPTIONS_ENDPOINT}:submit", params=_API_VERSION_PARAM, json=payload, timeout=_HTTP_TIMEOUT
-    )
+    resp = _session.post(_SUBMIT_URL, params=_API_VERSION_PARAM, json=payload, timeout=_HTTP_TIMEOUT)
 
     transcription_url: str = resp.json()["self"]
 
@@ -53,18 +54,19 @@ def send_transcription_request(rss_entry: PodcastRssEntry) -> str:
     return transcription_url
 
 
-def get_all_transcriptions(url: str | None = None) -> list[dict[str, Any]]:
-    """Get all transcriptions. Url is only required for pagination."""
-    if not url:
-        url = f"{_TRANSCRIPTIONS_ENDPOINT}?{urlencode(_API_VERSION_PARAM)}"
+def get_all_transcriptions() -> list[dict[str, Any]]:
+    """Get all transcriptions."""
+    return list(iter_transcriptions())
 
-    resp = _session.get(url, timeout=_HTTP_TIMEOUT).json()
-    transcriptions: list[Any] = resp["values"]
 
-    if "@nextLink" in resp:
-        transcriptions.extend(get_all_transcriptions(resp["@nextLink"]))
+def iter_transcriptions() -> Iterator[dict[str, Any]]:
+    """Iterate over all transcriptions, fetching the next page only when it is needed."""
+    url: str | None = _LIST_URL
 
-    return transcriptions
+    while url:
+        resp = _session.get(url, timeout=_HTTP_TIMEOUT).json()
+        yield from resp["values"]
+        url = resp.get("@nextLink")
 
 
 def get_transcription_results(files_url: str) -> RawTranscript:
@@ -97,16 +99,14 @@ def _convert_raw_transcription(raw_transcription: dict[str, Any]) -> RawTranscri
             logger.error(f"Found a segment without a best guess: {recognized_phrase}")
             continue
 
+        text = best_guess[0]["display"]
+        if not text:
+            continue
+
         start = recognized_phrase["offsetInTicks"] / _TICKS_PER_SECONDS
         end = start + (recognized_phrase["durationInTicks"] / _TICKS_PER_SECONDS)
 
-        transcription.append(
-            {
-                "start": start,
-                "end": end,
-                "text": _perform_low_level_text_corrections(best_guess[0]["display"]),
-            }
-        )
+        transcription.append({"start": start, "end": end, "text": _perform_low_level_text_corrections(text)})
 
     return transcription
 
@@ -19,6 +19,12 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 
+@functools.cache
+def _get_openai_client() -> OpenAI:
+    """Share one client so consecutive LLM requests reuse its connection pool."""
+    return OpenAI(organization=config.openai_organization, project=config.openai_project, api_key=config.openai_api_key)
+
+
 def cache_llm_for_segment(
     func: Callable[[int, "BaseSegment", "DiarizedTranscript"], float | None],
 ) -> Callable[[int, "BaseSegment", "DiarizedTranscript"], float | None]:
@@ -59,9 +65,7 @@ def get_segment_start_from_llm(
     _episode_number: int, segment: BaseSegment, transcript: DiarizedTranscript
 ) -> float | None:
     """Ask an LLM for the start time of a segment."""
-    client = OpenAI(
-        organization=config.openai_organization, project=config.openai_project, api_key=config.openai_api_key
-    )
+    client = _get_openai_client()
     system_prompt = (
         "You are a helpful assistant designed to output JSON."
         + "The user will provide you with a section of transcript"
@@ -79,7 +83,9 @@ def get_segment_start_from_llm(
         + "You should return the timestamp for the beginning of 'All right, well, let's go on with our interview.'"
     )
 
-    transcript_blob = f"transcript:\n\n````{json.dumps(transcript)}````"
+    # Compact separators and raw unicode keep the prompt, and so the token count, small.
+    transcript_json = json.dumps(transcript, separators=(",", ":"), ensure_ascii=False)
+    transcript_blob = f"transcript:\n\n````{transcript_json}````"
     user_prompt = f"{segment.llm_prompt}\n\n{transcript_blob}"
 
     logger.debug(f"Requesting LLM find start of segment: {segment}")
@@ -92,10 +98,11 @@ def get_segment_start_from_llm(
         ],
     )
 
-    if not response.choices[0].message.content:
+    content = response.choices[0].message.content
+    if not content:
         raise ValueError("LLM did not return a response.")
 
-    response_json: dict[str, float | None] = json.loads(response.choices[0].message.content)
+    response_json: dict[str, float | None] = json.loads(content)
     logger.debug(f"LLM response: {response_json}")
 
     return response_json.get("start_time")
@@ -107,9 +114,7 @@ def get_image_caption_from_llm(image_url: str) -> str:
     logger.debug("Getting image caption...")
     user_prompt = "Please write a 10-15 word caption for this image."
 
-    client = OpenAI(
-        organization=config.openai_organization, project=config.openai_project, api_key=config.openai_api_key
-    )
+    client = _get_openai_client()
     response = client.chat.completions.create(
         model=config.llm_model,
         messages=[
@@ -123,10 +128,10 @@ def get_image_caption_from_llm(image_url: str) -> str:
         ],
     )
 
-    if not response.choices[0].message.content:
+    image_caption = response.choices[0].message.content
+    if not image_caption:
         raise ValueError("LLM did not return a response.")
 
-    image_caption = response.choices[0].message.content
     logger.debug(f"LLM response: {image_caption}")
 
     return image_caption
@@ -144,9 +149,7 @@ def get_sof_metadata_from_llm(
     """
     logger.debug("Getting science or fiction metadata from llm...")
 
-    client = OpenAI(
-        organization=config.openai_organization, project=config.openai_project, api_key=config.openai_api_key
-    )
+    client = _get_openai_client()
     response = client.beta.chat.completions.parse(
         model=config.llm_model,
         messages=[
@@ -159,7 +162,8 @@ def get_sof_metadata_from_llm(
         response_format=ScienceOrFictionLlmData,
     )
 
-    if not response.choices[0].message.parsed:
+    sof_data = response.choices[0].message.parsed
+    if not sof_data:
         raise ValueError("LLM did not return a response.", response)
 
-    return response.choices[0].message.parsed
+    return sof_data
@@ -1,4 +1,8 @@
 import logging
+import time
+import weakref
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from functools import cache
 from http.client import NOT_FOUND
 
@@ -16,6 +20,12 @@ from transcription_bot.utils.global_http_client import HttpClient, http_client
 
 _EPISODE_PAGE_PREFIX = "SGU_Episode_"
 _EPISODE_LIST_PAGE_PREFIX = "Template:EpisodeList"
+_PAGE_FETCH_WORKERS = 8
+_CSRF_TOKEN_TTL = 30 * 60
+_PAGE_QUERY_HEADERS = {"User-Agent": "transcription-bot/1.0"}
+
+# The login is tied to the client's session cookies, so tokens are remembered per client.
+_csrf_tokens: weakref.WeakKeyDictionary[HttpClient, tuple[float, str]] = weakref.WeakKeyDictionary()
 
 
 # region public functions
@@ -40,11 +50,19 @@ def episode_has_wiki_page(client: HttpClient, episode_number: int) -> bool:
 
 
 def log_into_wiki(client: HttpClient) -> str:
-    """Perform a login to the wiki and return the csrf token."""
+    """Perform a login to the wiki and return the csrf token.
+
+    The token is reused for a while so that consecutive edits don't each repeat the login handshake.
+    """
+    if (cached := _csrf_tokens.get(client)) and time.monotonic() - cached[0] < _CSRF_TOKEN_TTL:
+        return cached[1]
+
     login_token = _get_login_token(client)
     _send_credentials(client, login_token)
+    csrf_token = _get_csrf_token(client)
 
-    return _get_csrf_token(client)
+    _csrf_tokens[client] = (time.monotonic(), csrf_token)
+    return csrf_token
 
 
 @retry(
@@ -82,6 +100,8 @@ def save_wiki_page(
     data = resp.json()
 
     if "error" in data:
+        # The token may have expired, so the retry should log in again.
+        _csrf_tokens.pop(client, None)
         raise RequestException("Error during page creation: %s", data["error"])
 
     logger.debug(data)
@@ -117,6 +137,16 @@ def get_episode_list_wiki_page(year: int) -> Wikicode:
     return episode_list
 
 
+def get_episode_wiki_pages(episode_numbers: Iterable[int]) -> dict[int, Wikicode]:
+    """Retrieve the wiki pages of several episodes concurrently."""
+    return _get_pages_concurrently(get_episode_wiki_page, episode_numbers)
+
+
+def get_episode_list_wiki_pages(years: Iterable[int]) -> dict[int, Wikicode]:
+    """Retrieve the episode lists of several years concurrently."""
+    return _get_pages_concurrently(get_episode_list_wiki_page, years)
+
+
 def get_episode_entry_from_list(episode_list_page: Wikicode, episode_number: str) -> SguListEntry | None:
     """Convert a wiki page to an SguListEntry."""
     template = get_episode_template_from_list(episode_list_page, episode_number)
@@ -128,12 +158,13 @@ def get_episode_entry_from_list(episode_list_page: Wikicode, episode_number: str
 
 def get_episode_template_from_list(episode_list_page: Wikicode, episode_number: str) -> Template | None:
     """Return the raw tuple from a wiki episode list."""
-    templates: list[Template] = episode_list_page.filter_templates()
-    for template in templates:
+    episode_number = str(episode_number)
+
+    for template in episode_list_page.ifilter_templates():
         if template.name.matches(SguListEntry.identifier) and template.has("episode"):
             param: Parameter = template.get("episode")
 
-            if param.value.strip_code().strip() == str(episode_number):
+            if param.value.strip_code().strip() == episode_number:
                 return template
 
     return None
@@ -154,9 +185,7 @@ def get_wiki_page(page_title: str) -> Wikicode:
         "rvlimit": 1,
         "formatversion": "2",
     }
-    headers = {"User-Agent": "transcription-bot/1.0"}
-
-    req = http_client.get(config.wiki_api_base, headers=headers, params=params)
+    req = http_client.get(config.wiki_api_base, headers=_PAGE_QUERY_HEADERS, params=params)
     json = req.json()
 
     if json["query"]["pages"][0].get("missing"):
@@ -198,6 +227,7 @@ def upload_image_to_wiki(client: HttpClient, image_url: str, episode_number: int
 
     upload_data = upload_response.json()
     if "error" in upload_data:
+        _csrf_tokens.pop(client, None)
         raise RequestException(f"Error uploading image: {upload_data['error']['info']}")
 
     return filename
@@ -205,6 +235,13 @@ def upload_image_to_wiki(client: HttpClient, image_url: str, episode_number: int
 
 # endregion
 # region private functions
+def _get_pages_concurrently(get_page: Callable[[int], Wikicode], keys: Iterable[int]) -> dict[int, Wikicode]:
+    unique_keys = list(dict.fromkeys(keys))
+
+    with ThreadPoolExecutor(max_workers=_PAGE_FETCH_WORKERS) as executor:
+        return dict(zip(unique_keys, executor.map(get_page, unique_keys), strict=True))
+
+
 def _get_login_token(client: HttpClient) -> str:
     params = {"action": "query", "meta": "tokens", "type": "login", "format": "json"}
 
@@ -80,6 +80,11 @@ class SguListEntry:
             rogue=other.rogue or self.rogue,
         )
 
+    @property
+    def has_segment_data(self) -> bool:
+        """Whether all of the values derived from the episode segments are populated."""
+        return all((self.other, self.theme, self.interviewee))
+
     @staticmethod
     def from_template(template: Template) -> "SguListEntry":
         """Construct an episode list entry from a template."""
@@ -128,10 +133,21 @@ class SguListEntry:
 
         return dict_representation
 
-    def update_template(self, template: Template) -> None:
-        """Modify a template to match the current object."""
+    def update_template(self, template: Template) -> bool:
+        """Modify a template to match the current object.
+
+        Returns:
+            bool: True if any parameter of the template was changed.
+        """
+        modified = False
         for k, v in self.to_dict().items():
+            if template.has(k) and str(template.get(k).value).strip() == (v or ""):
+                continue
+
             template.add(k, v)
+            modified = True
+
+        return modified
 
 
 @dataclass(frozen=True)
@@ -158,6 +174,11 @@ class PodcastRssEntry:
         """Get the year of the episode."""
         return self.date.year
 
+    @cached_property
+    def month_day(self) -> str:
+        """Get the date of the episode in MM-DD format."""
+        return f"{self.date.month:02d}-{self.date.day:02d}"
+
     @cached_property
     def download_url(self) -> str:
         """Get the download URL of the episode."""
@@ -1,9 +1,15 @@
 """Models for episode segments."""
 
+import dataclasses
+import itertools
 import math
 import re
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import field
+from functools import cache, lru_cache
 from typing import Any, ClassVar, NewType, override
 from urllib.parse import urlparse
 
@@ -14,7 +20,13 @@ from pydantic.dataclasses import dataclass
 
 from transcription_bot.models.simple_models import DiarizedTranscript
 from transcription_bot.utils.exceptions import StringMatchError
-from transcription_bot.utils.helpers import are_strings_in_string, find_single_element, get_article_title, string_is_url
+from transcription_bot.utils.helpers import (
+    are_strings_in_string,
+    find_single_element,
+    find_single_elements,
+    get_article_title,
+    string_is_url,
+)
 from transcription_bot.utils.templating import get_template
 
 SPECIAL_SUMMARY_PATTERNS = [
@@ -23,6 +35,16 @@ SPECIAL_SUMMARY_PATTERNS = [
     "live from",
     "live recording",
 ]
+_LOWERCASE_CACHE_SIZE = 4096
+_ARTICLE_TITLE_WORKERS = 8
+
+_FSOS_PATTERN = re.compile(r"forgotten superhero(es)? of science")
+_NOISY_PATTERN = re.compile(r"who.s that noisy")
+_SWINDLERS_LIST_PATTERN = re.compile(r"swindler.s list")
+_WHATS_THE_WORD_PATTERN = re.compile(r"what.s the word")
+_WHATS_THE_WORD_START_PATTERN = re.compile(r"what.?s the word")
+_NEWS_ITEM_PATTERN = re.compile(r"news items? ?[#$]?\d+\s*.\s*(.+)", re.IGNORECASE)
+_SOF_ITEM_NUMBER_PATTERN = re.compile(r"(\d+)")
 
 
 # region Base classes
@@ -62,6 +84,10 @@ class BaseSegment(ABC):
     def get_start_time(self, transcript: DiarizedTranscript) -> float | None:
         """Get the start time of the segment (or None in the case of failure)."""
 
+    def get_article_urls(self) -> list[str]:
+        """Get the URLs of the articles whose titles the segment renders."""
+        return []
+
     @property
     def duration(self) -> float:
         """Provide the duration of the segment in minutes."""
@@ -77,7 +103,7 @@ class BaseSegment(ABC):
         return template.render(
             wiki_anchor=self.wiki_anchor_tag,
             start_time=format_time(self.start_time),
-            transcript=format_transcript_for_wiki(self.transcript),
+            transcript=format_transcript_for_wiki(self.transcript) if self.transcript else "",
             **template_values,
         )
 
@@ -151,19 +177,15 @@ class DumbestThingOfTheWeekSegment(FromLyricsSegment, NonNewsSegmentMixin):
 
     @override
     def get_template_values(self) -> dict[str, Any]:
-        article_publication = None
-        article_title = None
-        if self.url:
-            article_publication = urlparse(self.url).netloc
-            article_title = get_article_title(self.url) or self.url
-
         return {
             "topic": self.topic,
-            "url": self.url,
-            "article_title": article_title,
-            "article_publication": article_publication,
+            **_get_article_template_values(self.url),
         }
 
+    @override
+    def get_article_urls(self) -> list[str]:
+        return [self.url] if self.url else []
+
     @override
     @staticmethod
     def match_string(lowercase_text: str) -> bool:
@@ -171,16 +193,12 @@ class DumbestThingOfTheWeekSegment(FromLyricsSegment, NonNewsSegmentMixin):
 
     @override
     def get_start_time(self, transcript: DiarizedTranscript) -> float | None:
-        for segment in transcript:
-            if are_strings_in_string(["dumb", "thing", "of", "the", "week"], segment["text"].lower()):
-                return segment["start"]
-
-        return None
+        return _find_start_of_keywords(transcript, ("dumb", "thing", "of", "the", "week"))
 
     @override
     @staticmethod
     def from_lyrics(text: str) -> "DumbestThingOfTheWeekSegment":
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
+        lines = _get_stripped_lines(text)
         lines += [""] * (3 - len(lines))
         _segment_name, topic, url, *extra = lines
 
@@ -219,12 +237,12 @@ class EmailSegment(FromLyricsSegment, FromShowNotesSegment):
     @override
     @staticmethod
     def match_string(lowercase_text: str) -> bool:
-        return lowercase_text.startswith("question #") or all(s in lowercase_text for s in ["your", "question", "mail"])
+        return lowercase_text.startswith("question #") or all(s in lowercase_text for s in ("your", "question", "mail"))
 
     @override
     def get_start_time(self, transcript: DiarizedTranscript) -> float | None:
         for segment in transcript:
-            if "mail" in segment["text"].lower() and segment["speaker"] == "Steve":
+            if "mail" in _lowercase(segment["text"]) and segment["speaker"] == "Steve":
                 return segment["start"]
 
         return None
@@ -236,14 +254,14 @@ class EmailSegment(FromLyricsSegment, FromShowNotesSegment):
         if ": " not in text:
             return EmailSegment(items=[])
 
-        raw_items = text.split(":")[1].split(",")
+        raw_items = text.partition(":")[2].split(",")
         items = [raw_item.strip() for raw_item in raw_items]
         return EmailSegment(items=items)
 
     @override
     @staticmethod
     def from_lyrics(text: str) -> "EmailSegment":
-        lines = [line.strip() for line in text.split("\n") if line.strip()][1:] + [None]  # sentinel value
+        lines = [*_get_stripped_lines(text)[1:], None]  # sentinel value
 
         items = []
         question = []
@@ -288,32 +306,24 @@ class ForgottenSuperheroesOfScienceSegment(FromLyricsSegment, FromSummaryTextSeg
     @override
     @staticmethod
     def match_string(lowercase_text: str) -> bool:
-        first_format = bool(re.match(r"forgotten superhero(es)? of science", lowercase_text))
-        second_format = bool(re.match(r"fsos", lowercase_text))
-        return first_format or second_format
+        return _FSOS_PATTERN.match(lowercase_text) is not None or lowercase_text.startswith("fsos")
 
     @override
     @override
     def get_start_time(self, transcript: DiarizedTranscript) -> float | None:
-        for chunk in transcript:
-            if are_strings_in_string(["forgotten", "hero", "science"], chunk["text"].lower()):
-                return chunk["start"]
-
-        return None
+        return _find_start_of_keywords(transcript, ("forgotten", "hero", "science"))
 
     @override
     @staticmethod
     def from_summary_text(text: str) -> "ForgottenSuperheroesOfScienceSegment":
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
-        lines += [""] * (1 - len(lines))
-        subject, *_ = lines
+        subject = next(filter(None, map(str.strip, text.split("\n"))), "")
 
         return ForgottenSuperheroesOfScienceSegment(subject=subject)
 
     @override
     @staticmethod
     def from_lyrics(text: str) -> "ForgottenSuperheroesOfScienceSegment":
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
+        lines = _get_stripped_lines(text)
         lines += [""] * (2 - len(lines))
         _segment_name, subject, *extra = lines
 
@@ -354,11 +364,7 @@ class InterviewSegment(FromLyricsSegment, FromShowNotesSegment):
 
     @override
     def get_start_time(self, transcript: DiarizedTranscript) -> float | None:
-        for chunk in transcript:
-            if are_strings_in_string(["go", "to", "interview"], chunk["text"].lower()):
-                return chunk["start"]
-
-        return None
+        return _find_start_of_keywords(transcript, ("go", "to", "interview"))
 
     @override
     @staticmethod
@@ -369,14 +375,15 @@ class InterviewSegment(FromLyricsSegment, FromShowNotesSegment):
     @staticmethod
     def from_show_notes(segment_data: list[Tag]) -> "InterviewSegment":
         text = segment_data[0].text
-        name = re.split(r"[w|W]ith", text)[1]
+        with_index = text.lower().find("with")
+        name = text[with_index + len("with") :] if with_index >= 0 else text
 
         return InterviewSegment(name=name.strip(":- "), url="")
 
     @override
     @staticmethod
     def from_lyrics(text: str) -> "InterviewSegment":
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
+        lines = _get_stripped_lines(text)
         lines += [""] * (2 - len(lines))
         name, url, *extra = lines
 
@@ -455,16 +462,12 @@ class LogicalFallacySegment(FromLyricsSegment, NonNewsSegmentMixin):
 
     @override
     def get_start_time(self, transcript: DiarizedTranscript) -> float | None:
-        for chunk in transcript:
-            if are_strings_in_string(["name", "logical", "fallacy"], chunk["text"].lower()):
-                return chunk["start"]
-
-        return None
+        return _find_start_of_keywords(transcript, ("name", "logical", "fallacy"))
 
     @override
     @staticmethod
     def from_lyrics(text: str) -> "LogicalFallacySegment":
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
+        lines = _get_stripped_lines(text)
         lines += [""] * (2 - len(lines))
         _segment_name, *topic = lines
 
@@ -499,15 +502,11 @@ class NoisySegment(FromLyricsSegment, FromShowNotesSegment):
     @override
     @staticmethod
     def match_string(lowercase_text: str) -> bool:
-        return bool(re.search(r"who.s that noisy", lowercase_text))
+        return _NOISY_PATTERN.search(lowercase_text) is not None
 
     @override
     def get_start_time(self, transcript: DiarizedTranscript) -> float | None:
-        for segment in transcript:
-            if are_strings_in_string(["who", "that", "noisy"], segment["text"].lower()):
-                return segment["start"]
-
-        return None
+        return _find_start_of_keywords(transcript, ("who", "that", "noisy"))
 
     @override
     @staticmethod
@@ -519,7 +518,7 @@ class NoisySegment(FromLyricsSegment, FromShowNotesSegment):
         for splitter in NoisySegment.valid_splitters:
             if splitter in segment_data[1].text:
                 return NoisySegment(
-                    last_week_answer=segment_data[1].text.split(splitter)[1].strip(),
+                    last_week_answer=segment_data[1].text.partition(splitter)[2].strip(),
                 )
 
         return NoisySegment()
@@ -559,14 +558,9 @@ class OutroSegment(BaseSegment):
 
     @override
     def get_start_time(self, transcript: DiarizedTranscript) -> float | None:
-        for chunk in transcript:
-            if are_strings_in_string(
-                ["skeptic", "guide", "to", "the", "universe", "produced", "by", "sgu", "productions"],
-                chunk["text"].lower(),
-            ):
-                return chunk["start"]
-
-        return None
+        return _find_start_of_keywords(
+            transcript, ("skeptic", "guide", "to", "the", "universe", "produced", "by", "sgu", "productions")
+        )
 
 
 @dataclass(kw_only=True)
@@ -592,40 +586,28 @@ class QuickieSegment(FromLyricsSegment, NonNewsSegmentMixin):
 
     @override
     def get_template_values(self) -> dict[str, Any]:
-        article_publication = None
-        article_title = None
-
-        if self.url:
-            article_publication = urlparse(self.url).netloc
-            article_title = get_article_title(self.url) or self.url
-
         return {
             "title": self.title,
             "subject": self.subject,
-            "url": self.url,
-            "article_title": article_title,
-            "article_publication": article_publication,
+            **_get_article_template_values(self.url),
         }
 
+    @override
+    def get_article_urls(self) -> list[str]:
+        return [self.url] if self.url else []
+
     @override
     @staticmethod
     def match_string(lowercase_text: str) -> bool:
         return lowercase_text.startswith("quickie with")
 
     def get_start_time(self, transcript: DiarizedTranscript) -> float | None:
-        for chunk in transcript:
-            if are_strings_in_string(["quickie", "with"], chunk["text"].lower()):
-                return chunk["start"]
-
-            if are_strings_in_string(self.subject.split(), chunk["text"].lower()):
-                return chunk["start"]
-
-        return None
+        return _find_start_of_keywords(transcript, ("quickie", "with"), self.subject.split())
 
     @override
     @staticmethod
     def from_lyrics(text: str) -> "QuickieSegment":
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
+        lines = _get_stripped_lines(text)
         lines += [""] * (3 - len(lines))
         title, subject, url, *extra = lines
 
@@ -671,7 +653,7 @@ class QuoteSegment(FromLyricsSegment):
     @override
     def get_start_time(self, transcript: DiarizedTranscript) -> float | None:
         for segment in transcript:
-            text = segment["text"].lower()
+            text = _lowercase(segment["text"])
             if "quote" in text and segment["speaker"] == "Steve":
                 return segment["start"]
 
@@ -680,7 +662,7 @@ class QuoteSegment(FromLyricsSegment):
     @override
     @staticmethod
     def from_lyrics(text: str) -> "QuoteSegment":
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
+        lines = _get_stripped_lines(text)
         lines += [""] * (3 - len(lines))
         _segment_name, quote, attribution, *extra = lines
 
@@ -720,42 +702,34 @@ class SwindlersListSegment(FromLyricsSegment, FromSummaryTextSegment, NonNewsSeg
 
     @override
     def get_template_values(self) -> dict[str, Any]:
-        article_publication = None
-        article_title = None
-        if self.url:
-            article_publication = urlparse(self.url).netloc
-            article_title = get_article_title(self.url) or self.url
-
         return {
             "topic": self.topic,
-            "url": self.url,
-            "article_title": article_title,
-            "article_publication": article_publication,
+            **_get_article_template_values(self.url),
         }
 
+    @override
+    def get_article_urls(self) -> list[str]:
+        return [self.url] if self.url else []
+
     @override
     @staticmethod
     def match_string(lowercase_text: str) -> bool:
-        return bool(re.match(r"swindler.s list", lowercase_text))
+        return _SWINDLERS_LIST_PATTERN.match(lowercase_text) is not None
 
     @override
     def get_start_time(self, transcript: DiarizedTranscript) -> float | None:
-        for chunk in transcript:
-            if are_strings_in_string(["swindler", "list"], chunk["text"].lower()):
-                return chunk["start"]
-
-        return None
+        return _find_start_of_keywords(transcript, ("swindler", "list"))
 
     @override
     @staticmethod
     def from_summary_text(text: str) -> "SwindlersListSegment":
-        topic = text.split(":")[1].strip()
-        return SwindlersListSegment(topic=topic, url=None)
+        _, _, topic = text.partition(":")
+        return SwindlersListSegment(topic=topic.strip(), url=None)
 
     @override
     @staticmethod
     def from_lyrics(text: str) -> "SwindlersListSegment":
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
+        lines = _get_stripped_lines(text)
         lines += [""] * (3 - len(lines))
         _segment_name, topic, url, *extra = lines
 
@@ -796,16 +770,12 @@ class TikTokSegment(FromLyricsSegment):
 
     @override
     def get_start_time(self, transcript: DiarizedTranscript) -> float | None:
-        for chunk in transcript:
-            if are_strings_in_string(self.title.split(), chunk["text"].lower()):
-                return chunk["start"]
-
-        return None
+        return _find_start_of_keywords(transcript, self.title.split())
 
     @override
     @staticmethod
     def from_lyrics(text: str) -> "TikTokSegment":
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
+        lines = _get_stripped_lines(text)
         lines += [""] * (3 - len(lines))
         _segment_name, title, url, *extra = lines
 
@@ -855,18 +825,11 @@ class UnknownSegment(BaseSegment):
 
     @override
     def get_start_time(self, transcript: DiarizedTranscript) -> float | None:
-        for chunk in transcript:
-            if are_strings_in_string(self.title.split(), chunk["text"].lower()):
-                return chunk["start"]
-
-            if are_strings_in_string(self.extra_text.split(), chunk["text"].lower()):
-                return chunk["start"]
-
-        return None
+        return _find_start_of_keywords(transcript, self.title.split(), self.extra_text.split())
 
     @staticmethod
     def create(text: str) -> "UnknownSegment":
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
+        lines = _get_stripped_lines(text)
         lines += [""] * (1 - len(lines))
         title, *extra_lines = lines
 
@@ -913,15 +876,17 @@ class WhatsTheWordSegment(FromLyricsSegment, NonNewsSegmentMixin):
     @override
     @staticmethod
     def match_string(lowercase_text: str) -> bool:
-        return bool(re.match(r"what.s the word", lowercase_text))
+        return _WHATS_THE_WORD_PATTERN.match(lowercase_text) is not None
 
     @override
     def get_start_time(self, transcript: DiarizedTranscript) -> float | None:
+        word = self.word.lower()
         for chunk in transcript:
-            if re.match(r"what.?s the word", chunk["text"].lower()):
+            text = _lowercase(chunk["text"])
+            if _WHATS_THE_WORD_START_PATTERN.match(text):
                 return chunk["start"]
 
-            if self.word.lower() in chunk["text"].lower():
+            if word in text:
                 return chunk["start"]
 
         return None
@@ -929,7 +894,7 @@ class WhatsTheWordSegment(FromLyricsSegment, NonNewsSegmentMixin):
     @override
     @staticmethod
     def from_lyrics(text: str) -> "WhatsTheWordSegment":
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
+        lines = _get_stripped_lines(text)
         lines += [""] * (2 - len(lines))
         _segment_name, word, *extra = lines
 
@@ -967,20 +932,16 @@ class NewsItem(BaseSegment):
 
     @override
     def get_template_values(self) -> dict[str, Any]:
-        article_publication = None
-        article_title = None
-        if self.url:
-            article_publication = urlparse(self.url).netloc
-            article_title = get_article_title(self.url) or self.url
-
         return {
             "item_number": self.item_number,
             "topic": self.topic,
-            "url": self.url,
-            "article_title": article_title,
-            "article_publication": article_publication,
+            **_get_article_template_values(self.url),
         }
 
+    @override
+    def get_article_urls(self) -> list[str]:
+        return [self.url] if self.url else []
+
     @override
     @staticmethod
     def match_string(lowercase_text: str) -> bool:
@@ -1035,16 +996,13 @@ class NewsMetaSegment(FromLyricsSegment):
         items: list[NewsItem] = []
         item_counter = 0
 
-        for index, line in enumerate(lines):
+        for line, next_line in itertools.pairwise([*lines, ""]):
             if "news item" in line.lower():
                 item_counter += 1
 
-                url = None
-                next_index = index + 1
-                if next_index < len(lines) and string_is_url(lines[next_index]):
-                    url = lines[next_index]
+                url = next_line if string_is_url(next_line) else None
 
-                match = re.match(r"news items? ?[#$]?\d+\s*.\s*(.+)", line, re.IGNORECASE)
+                match = _NEWS_ITEM_PATTERN.match(line)
                 if not match:
                     raise StringMatchError(f"Failed to extract news topic from: {line}")
                 topic = match.group(1).strip()
@@ -1056,7 +1014,8 @@ class NewsMetaSegment(FromLyricsSegment):
 
 # endregion
 # region Science or Fiction
-@dataclass(kw_only=True)
+# These are only built internally (many per episode), so they skip pydantic validation and use slots.
+@dataclasses.dataclass(kw_only=True, slots=True)
 class ScienceOrFictionItem:
     number: int
     name: str
@@ -1067,7 +1026,7 @@ class ScienceOrFictionItem:
     article_publication: str | None
 
 
-@dataclass
+@dataclasses.dataclass(slots=True)
 class RogueGuess:
     num: int
     name: str
@@ -1077,7 +1036,7 @@ class RogueGuess:
         return self.answer.sof_result == "fiction"
 
 
-@dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class ScienceOrFictionMetadata:
     rogues: list[RogueGuess]
     host: str
@@ -1150,11 +1109,16 @@ class ScienceOrFictionSegment(FromLyricsSegment, FromShowNotesSegment):
     @override
     def get_start_time(self, transcript: DiarizedTranscript) -> float | None:
         for segment in transcript:
-            if "time for science or fiction" in segment["text"].lower():
+            if "time for science or fiction" in _lowercase(segment["text"]):
                 return segment["start"]
 
         return None
 
+    @override
+    def get_article_urls(self) -> list[str]:
+        urls = (_get_sof_item_article_url(find_single_element(raw_item, "p", None)) for raw_item in self.raw_items)
+        return [url for url in urls if url]
+
     @override
     @staticmethod
     def from_show_notes(segment_data: list[Tag]) -> "ScienceOrFictionSegment":
@@ -1167,34 +1131,30 @@ class ScienceOrFictionSegment(FromLyricsSegment, FromShowNotesSegment):
 
         science_items = 1
         for raw_item in raw_items:
-            title_text = find_single_element(raw_item, "span", "science-fiction__item-title").text
-            match = re.search(r"(\d+)", title_text)
+            title_span, p_tag, answer_span = find_single_elements(
+                raw_item, ("span", "science-fiction__item-title"), ("p", None), ("span", "quiz__answer")
+            )
+
+            title_text = title_span.text
+            match = _SOF_ITEM_NUMBER_PATTERN.search(title_text)
             if not match:
                 raise StringMatchError(f"Failed to extract item number from: {title_text}")
 
             item_number = int(match.group(1))
 
-            p_tag = find_single_element(raw_item, "p", None)
             p_text = p_tag.text.strip()
 
             if better_tag := p_tag.next:
                 p_text = better_tag.text.strip()
 
-            answer = find_single_element(raw_item, "span", "quiz__answer").text
+            answer = answer_span.text
 
-            try:
-                a_tag = find_single_element(p_tag, "a", None)
-                article_url = a_tag.get("href", "")
-                if not isinstance(article_url, str):
-                    raise TypeError("Got an unexpected type in url")
-            except ValueError:
-                article_url = ""
+            article_url = _get_sof_item_article_url(p_tag)
 
             publication = None
             article_title = None
             if article_url:
-                publication = urlparse(article_url).netloc
-                article_title = get_article_title(article_url) or article_url
+                publication, article_title = _get_article_details(article_url)
 
             if answer.lower() == "science":
                 sof_result = f"science{science_items}"
@@ -1218,79 +1178,138 @@ class ScienceOrFictionSegment(FromLyricsSegment, FromShowNotesSegment):
     @override
     @staticmethod
     def from_lyrics(text: str) -> "ScienceOrFictionSegment":
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
+        lines = _get_stripped_lines(text)
         theme = None
 
         for line in lines:
             if line.lower().startswith("theme:"):
-                theme = line.split(":")[1].strip()
+                theme = line.partition(":")[2].strip()
                 break
 
         return ScienceOrFictionSegment(raw_items=[], theme=theme)
 
 
 # endregion
-# region Formatters
-def _abbreviate_speakers(transcript: DiarizedTranscript) -> None:
-    for chunk in transcript:
-        if chunk["speaker"] == "Voice-over":
-            continue
+# region Parsing helpers
+def _get_article_details(url: str) -> tuple[str, str]:
+    """Get the publication and title of an article, falling back to the URL for the title.
 
-        if "SPEAKER_" in chunk["speaker"]:
-            name = "US#" + chunk["speaker"].split("_")[1]
-            chunk["speaker"] = name
-        else:
-            chunk["speaker"] = chunk["speaker"][0]
+    The same few publications recur across items and episodes, so their names are interned.
+    """
+    return sys.intern(urlparse(url).netloc), get_article_title(url) or url
 
 
-def format_transcript_for_wiki(transcript: DiarizedTranscript) -> str:
-    """Format the transcript for the wiki."""
-    transcript = _trim_whitespace(transcript)
-    transcript = _join_speaker_transcription_chunks(transcript)
-    _abbreviate_speakers(transcript)
+def _get_article_template_values(url: str | None) -> dict[str, str | None]:
+    """Get the url, article_title and article_publication values for a segment that links to an article."""
+    article_publication = None
+    article_title = None
+    if url:
+        article_publication, article_title = _get_article_details(url)
 
-    text_chunks = [f"'''{ts_chunk['speaker']}:''' {ts_chunk['text']}" for ts_chunk in transcript]
+    return {"url": url, "article_title": article_title, "article_publication": article_publication}
 
-    return "\n\n".join(text_chunks)
 
+def _get_sof_item_article_url(p_tag: Tag) -> str:
+    """Get the URL of the article linked from a Science or Fiction item, or an empty string if there is none."""
+    try:
+        a_tag = find_single_element(p_tag, "a", None)
+    except ValueError:
+        return ""
 
-def format_time(time: float | None) -> str:
-    """Format a float time to h:mm:ss or mm:ss if < 1 hour."""
-    if not time:
-        return "???"
+    article_url = a_tag.get("href", "")
+    if not isinstance(article_url, str):
+        raise TypeError("Got an unexpected type in url")
+
+    return article_url
 
-    hour_count = int(time) // 3600
 
-    hour = ""
-    if hour_count:
-        hour = f"{hour_count}:"
+def _get_stripped_lines(text: str) -> list[str]:
+    """Get the non-empty lines of the text, stripped of surrounding whitespace."""
+    return [stripped_line for line in text.split("\n") if (stripped_line := line.strip())]
 
-    minutes = f"{int(time) // 60 % 60:02d}:"
-    seconds = f"{int(time) % 60:02d}"
 
-    return f"{hour}{minutes}{seconds}"
+# endregion
+# region Transcript search
+@lru_cache(maxsize=_LOWERCASE_CACHE_SIZE)
+def _lowercase(text: str) -> str:
+    return text.lower()
 
 
-def _trim_whitespace(transcript: DiarizedTranscript) -> DiarizedTranscript:
-    for chunk in transcript:
-        chunk["text"] = chunk["text"].strip()
+@lru_cache
+def _prepare_keywords(keywords: tuple[str, ...]) -> tuple[str, ...]:
+    """Reduce a keyword set to the lowercase keywords that need to be checked, longest first.
 
-    return transcript
+    Longer keywords are usually rarer, so checking them first rejects most chunks on the first test.
+    Keywords that are contained in another keyword are dropped, since finding the longer one implies the shorter.
+    """
+    unique_keywords = sorted({keyword.lower() for keyword in keywords}, key=lambda keyword: (-len(keyword), keyword))
+    return tuple(
+        keyword
+        for i, keyword in enumerate(unique_keywords)
+        if not any(keyword in longer_keyword for longer_keyword in unique_keywords[:i])
+    )
 
 
-def _join_speaker_transcription_chunks(transcript: DiarizedTranscript) -> DiarizedTranscript:
-    current_speaker = None
+def _find_start_of_keywords(transcript: DiarizedTranscript, *keyword_sets: Sequence[str]) -> float | None:
+    """Find the start of the first chunk that contains all keywords of any of the keyword sets.
+
+    Each segment type scans the same chunks, so the lowercased text is cached across calls.
+    """
+    prepared_keyword_sets = [_prepare_keywords(tuple(keywords)) for keywords in keyword_sets]
+
+    # A chunk shorter than the longest keyword of every set cannot match, which skips most backchannel chunks.
+    min_text_length = min((len(keywords[0]) if keywords else 0 for keywords in prepared_keyword_sets), default=0)
 
-    speaker_chunks: DiarizedTranscript = []
     for chunk in transcript:
-        if chunk["speaker"] != current_speaker:
-            speaker_chunks.append(chunk)
-            current_speaker = chunk["speaker"]
-        else:
-            speaker_chunks[-1]["text"] += " " + chunk["text"]
-            speaker_chunks[-1]["end"] = chunk["end"]
+        if len(chunk["text"]) < min_text_length:
+            continue
 
-    return speaker_chunks
+        text = _lowercase(chunk["text"])
+        for keywords in prepared_keyword_sets:
+            if are_strings_in_string(keywords, text):
+                return chunk["start"]
+
+    return None
+
+
+# endregion
+# region Formatters
+@cache
+def _abbreviate_speaker(speaker: str) -> str:
+    if speaker == "Voice-over":
+        return speaker
+
+    if "SPEAKER_" in speaker:
+        return "US#" + speaker.partition("_")[2]
+
+    return speaker[0]
+
+
+def format_transcript_for_wiki(transcript: DiarizedTranscript) -> str:
+    """Format the transcript for the wiki.
+
+    Consecutive chunks from the same speaker are joined into a single line. The transcript is not modified.
+    """
+    text_chunks = [
+        f"'''{_abbreviate_speaker(speaker)}:''' {' '.join(chunk['text'].strip() for chunk in speaker_chunks)}"
+        for speaker, speaker_chunks in itertools.groupby(transcript, key=lambda chunk: chunk["speaker"])
+    ]
+
+    return "\n\n".join(text_chunks)
+
+
+def format_time(time: float | None) -> str:
+    """Format a float time to h:mm:ss or mm:ss if < 1 hour."""
+    if time is None:
+        return "???"
+
+    minutes, seconds = divmod(int(time), 60)
+    hours, minutes = divmod(minutes, 60)
+
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+    return f"{minutes:02d}:{seconds:02d}"
 
 
 def _create_science_or_fiction_metadata(
@@ -1345,11 +1364,24 @@ def _create_science_or_fiction_metadata(
 # endregion
 # region Global-level definitions
 _PARSER_SEGMENT_TYPES = (FromLyricsSegment, FromSummaryTextSegment, FromShowNotesSegment)
-segment_types = [
+segment_types: tuple[type[BaseSegment], ...] = tuple(
     value
     for value in globals().values()
     if isinstance(value, type) and issubclass(value, _PARSER_SEGMENT_TYPES) and value not in _PARSER_SEGMENT_TYPES
-]
+)
+
+
+def prefetch_article_titles(segments: Iterable[BaseSegment]) -> None:
+    """Fetch the titles of all articles linked by the segments concurrently, so rendering reads them from the cache."""
+    urls = {url for segment in segments for url in segment.get_article_urls()}
+
+    with ThreadPoolExecutor(max_workers=_ARTICLE_TITLE_WORKERS) as executor:
+        list(executor.map(get_article_title, urls))
+
+
+def get_matching_segment_types(lowercase_text: str) -> list[type[BaseSegment]]:
+    """Get every segment type whose match_string accepts the text, in segment_types order."""
+    return [segment_class for segment_class in segment_types if segment_class.match_string(lowercase_text)]
 
 
 RawSegments = NewType("RawSegments", list[BaseSegment])
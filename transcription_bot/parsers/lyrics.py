@@ -5,7 +5,7 @@ from transcription_bot.models.episode_segments import (
     FromLyricsSegment,
     RawSegments,
     UnknownSegment,
-    segment_types,
+    get_matching_segment_types,
 )
 
 
@@ -22,14 +22,12 @@ def _create_segment_from_lyric_chunk(text: str) -> "BaseSegment|None":
     text = re.sub(r"segment #?\d+[-\.:;]?", "", text, flags=re.IGNORECASE).strip()
     match_text = text.lower().strip()
 
-    found_match = False
-    for segment_class in segment_types:
-        if segment_class.match_string(match_text):
-            found_match = True
-            if issubclass(segment_class, FromLyricsSegment):
-                return segment_class.from_lyrics(text)
+    matching_segment_types = get_matching_segment_types(match_text)
+    for segment_class in matching_segment_types:
+        if issubclass(segment_class, FromLyricsSegment):
+            return segment_class.from_lyrics(text)
 
-    if found_match:
+    if matching_segment_types:
         raise ValueError(f"Match found in other parsers: {text}")
 
     return UnknownSegment.create(text=text)
@@ -11,8 +11,13 @@ from transcription_bot.utils.config import config
 EPISODE_PATTERN = r"^SGU Episode (\d{1,4})$"
 
 
-def get_podcast_rss_entries(client: Session) -> list[PodcastRssEntry]:
-    """Retrieve the list of SGU podcast episodes from  the RSS feed."""
+def get_podcast_rss_entries(client: Session, min_episode_number: int = 1) -> list[PodcastRssEntry]:
+    """Retrieve the list of SGU podcast episodes from  the RSS feed.
+
+    Args:
+        client: The HTTP client to use.
+        min_episode_number: Episodes numbered below this are skipped without being parsed.
+    """
     response = client.get(config.podcast_rss_url)
 
     raw_feed_entries = feedparser.parse(response.text)["entries"]
@@ -23,7 +28,10 @@ def get_podcast_rss_entries(client: Session) -> list[PodcastRssEntry]:
 
         # Skip episodes that don't have a number.
         if episode_number <= 0:
-            logger.debug(f"Skipping episode due to number: {entry["title"]}")
+            logger.debug(f"Skipping episode due to number: {entry['title']}")
+            continue
+
+        if episode_number < min_episode_number:
             continue
 
         raw_download_url = entry["links"][0]["href"]
@@ -38,7 +46,7 @@ def get_podcast_rss_entries(client: Session) -> list[PodcastRssEntry]:
 
         rss_entries.append(
             PodcastRssEntry(
-                episode_number=int(entry["link"].split("/")[-1]),
+                episode_number=episode_number,
                 official_title=entry["title"],
                 summary=entry["summary"],
                 raw_download_url=raw_download_url,
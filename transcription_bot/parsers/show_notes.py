@@ -7,7 +7,7 @@ from transcription_bot.models.episode_segments import (
     FromShowNotesSegment,
     RawSegments,
     UnknownSegment,
-    segment_types,
+    get_matching_segment_types,
 )
 from transcription_bot.utils.helpers import find_single_element
 
@@ -45,14 +45,12 @@ def _create_segments(segment_data: list["Tag"]) -> "BaseSegment|None":
     text = segment_data[0].text
     lower_text = text.lower()
 
-    found_match = False
-    for segment_class in segment_types:
-        if segment_class.match_string(lower_text):
-            found_match = True
-            if issubclass(segment_class, FromShowNotesSegment):
-                return segment_class.from_show_notes(segment_data)
+    matching_segment_types = get_matching_segment_types(lower_text)
+    for segment_class in matching_segment_types:
+        if issubclass(segment_class, FromShowNotesSegment):
+            return segment_class.from_show_notes(segment_data)
 
-    if found_match:
+    if matching_segment_types:
         return None
 
     return UnknownSegment.create(text=text)
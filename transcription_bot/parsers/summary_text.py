@@ -3,7 +3,7 @@ from transcription_bot.models.episode_segments import (
     BaseSegment,
     FromSummaryTextSegment,
     RawSegments,
-    segment_types,
+    get_matching_segment_types,
 )
 
 
@@ -17,14 +17,12 @@ def parse_summary_text(summary: str) -> RawSegments:
 def _create_segment_from_summary_text(text: str) -> "BaseSegment|None":
     lower_text = text.lower()
 
-    found_match = False
-    for segment_class in segment_types:
-        if segment_class.match_string(lower_text):
-            found_match = True
-            if issubclass(segment_class, FromSummaryTextSegment):
-                return segment_class.from_summary_text(text)
+    matching_segment_types = get_matching_segment_types(lower_text)
+    for segment_class in matching_segment_types:
+        if issubclass(segment_class, FromSummaryTextSegment):
+            return segment_class.from_summary_text(text)
 
-    if found_match:
+    if matching_segment_types:
         return None
 
     if _is_special_summary_text(lower_text):
@@ -1,6 +1,6 @@
 from transcription_bot.interfaces.llm_interface import get_image_caption_from_llm
 from transcription_bot.models.episode_data import EpisodeData
-from transcription_bot.models.episode_segments import QuoteSegment
+from transcription_bot.models.episode_segments import QuoteSegment, prefetch_article_titles
 from transcription_bot.utils.helpers import get_first_segment_of_type
 from transcription_bot.utils.templating import get_template
 
@@ -12,6 +12,8 @@ def create_podcast_wiki_page(episode_data: EpisodeData) -> str:
     and converts the segments into wiki page content.
     """
     episode_raw_data = episode_data.raw_data
+
+    prefetch_article_titles(episode_data.segments)
     segment_text = "\n".join(s.to_wiki() for s in episode_data.segments)
 
     rogues = {s["speaker"].lower() for s in episode_data.transcript}
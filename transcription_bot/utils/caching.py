@@ -1,6 +1,7 @@
 import functools
 import json
 import pickle
+import threading
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any, Concatenate, ParamSpec, Protocol, TypeVar, cast
@@ -50,18 +51,28 @@ def cache_for_episode(
 
 
 def cache_for_url(func: Callable[Concatenate[Url, P], R]) -> Callable[Concatenate[Url, P], R]:
-    """Provide caching for title page lookups."""
+    """Provide caching for title page lookups.
+
+    The cache file is read on the first call and kept in memory; it is only rewritten when a new URL is fetched.
+    """
+    url_cache: UrlCache[R] | None = None
+    # The function itself runs outside the lock so that lookups from several threads can fetch concurrently.
+    lock = threading.Lock()
 
     @functools.wraps(func)
     def wrapper(url: Url, *args: P.args, **kwargs: P.kwargs) -> R:
-        function_dir = get_cache_dir(func)
-        cache_filepath = function_dir / "urls.json_or_pkl"
+        nonlocal url_cache
 
-        url_cache: UrlCache[R] = {}
-        if cache_filepath.exists():
-            url_cache = load_cache(cache_filepath)
+        cache_filepath = get_cache_dir(func) / "urls.json_or_pkl"
+
+        with lock:
+            if url_cache is None:
+                loaded_cache: UrlCache[R] = load_cache(cache_filepath) if cache_filepath.exists() else {}
+                url_cache = loaded_cache
+            else:
+                loaded_cache = url_cache
 
-        title = url_cache.get(url, _sentinel)
+            title = loaded_cache.get(url, _sentinel)
 
         if title is not _sentinel:
             logger.debug(f"Using url cache for: {url}")
@@ -69,8 +80,9 @@ def cache_for_url(func: Callable[Concatenate[Url, P], R]) -> Callable[Concatenat
 
         result = func(url, *args, **kwargs)
 
-        url_cache[url] = result
-        save_cache(cache_filepath, url_cache)
+        with lock:
+            loaded_cache[url] = result
+            save_cache(cache_filepath, loaded_cache)
 
         return result
 
@@ -89,11 +101,19 @@ def get_cache_dir(func: Callable[..., Any]) -> Path:
 
 
 def save_cache(file: Path, data: Any) -> None:
-    """Save data to the cache file."""
+    """Save data to the cache file.
+
+    The data is written to a temporary file that then replaces the cache file,
+    so a run that dies mid-write can't leave a truncated cache for the next run to resume from.
+    """
+    temp_file = file.with_name(f"{file.name}.tmp")
+
     try:
-        file.write_text(json.dumps(data))
+        temp_file.write_text(json.dumps(data))
     except (TypeError, OverflowError):
-        file.write_bytes(pickle.dumps(data))
+        temp_file.write_bytes(pickle.dumps(data))
+
+    temp_file.replace(file)
 
 
 def load_cache(file: Path) -> Any:
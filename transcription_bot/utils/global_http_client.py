@@ -2,6 +2,7 @@ import logging
 from typing import Any
 
 import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
 from tenacity import before_sleep_log, retry, stop_after_attempt, wait_fixed
 
 __all__ = ["http_client"]
@@ -10,17 +11,26 @@ CUSTOM_USER_AGENT = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36 Edg/127.0.0.0"
 }
 _HTTP_TIMEOUT = 15
+_POOL_SIZE = 16
 
 
 class HttpClient(requests.Session):
-    def __init__(self):
+    def __init__(self, adapter: BaseAdapter | None = None):
         super().__init__()
         self.headers.update(CUSTOM_USER_AGENT)
 
-    @staticmethod
-    def with_auth_header(header: dict[str, str]) -> "HttpClient":
-        client = HttpClient()
+        if adapter is None:
+            # Retries are handled by tenacity in _request, so the adapter only needs a larger keep-alive pool.
+            adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def with_auth_header(self, header: dict[str, str]) -> "HttpClient":
+        # Headers are set per request, so the new client can share this client's keep-alive connections.
+        client = HttpClient(self.get_adapter("https://"))
         client.headers.update(header)
+
         return client
 
     def get(self, *args: Any, raise_for_status: bool = True, **kwargs: Any) -> requests.Response:
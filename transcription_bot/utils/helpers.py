@@ -1,5 +1,5 @@
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any, TypeVar
 from urllib.parse import urlparse
 
@@ -22,7 +22,7 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="BaseSegment")
 
 
-def are_strings_in_string(strings: list[str], string: str) -> bool:
+def are_strings_in_string(strings: Sequence[str], string: str) -> bool:
     """Check if all strings are in a given string."""
     return all(s in string for s in strings)
 
@@ -41,12 +41,35 @@ def find_single_element(soup: "BeautifulSoup | Tag", name: str, class_name: str
     Raises:
         ValueError: If the number of extracted elements is not equal to 1.
     """
-    results = soup.find_all(name, class_=class_name)
+    return find_single_elements(soup, (name, class_name))[0]
 
-    if len(results) != 1:
-        raise ValueError(f"Unexpected number of description elements extracted, expected 1, got {len(results)}")
 
-    return results[0]
+def find_single_elements(soup: "BeautifulSoup | Tag", *targets: tuple[str, str | None]) -> list[Tag]:
+    """Extract several single HTML elements from a BeautifulSoup object or Tag in one traversal.
+
+    Args:
+        soup: The BeautifulSoup object or Tag to search in.
+        targets: The (name, class_name) pairs to extract, as would be passed to find_single_element.
+
+    Returns:
+        list[Tag]: The extracted HTML elements, in the order of the targets.
+
+    Raises:
+        ValueError: If the number of elements extracted for any target is not equal to 1.
+    """
+    results: list[list[Tag]] = [[] for _ in targets]
+
+    for tag in soup.find_all({name for name, _ in targets}):
+        for (name, class_name), target_results in zip(targets, results, strict=True):
+            if tag.name == name and (class_name is None or class_name in tag.get_attribute_list("class")):
+                target_results.append(tag)
+
+    for (name, class_name), target_results in zip(targets, results, strict=True):
+        if len(target_results) != 1:
+            target = f"<{name} class={class_name!r}>"
+            raise ValueError(f"Unexpected number of {target} elements extracted, expected 1, got {len(target_results)}")
+
+    return [target_results[0] for target_results in results]
 
 
 @cache_for_url
@@ -136,8 +159,11 @@ def run_main_safely(func: Callable[..., None], *args: Any, **kwargs: Any) -> Non
 
 
 def setup_tracing(config: ConfigProto) -> None:
-    """Set up tracing."""
-    if not config.local_mode:
+    """Set up tracing.
+
+    This is called by the entrypoints when run as a script (rather than on import) and is safe to call repeatedly.
+    """
+    if not config.local_mode and not sentry_sdk.get_client().is_active():
         sentry_loguru = LoguruIntegration(
             level=LoggingLevels.DEBUG.value,
             event_level=LoggingLevels.WARNING.value,
@@ -1,3 +1,5 @@
+from functools import cache
+
 from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template
 
 from transcription_bot.utils.config import TEMPLATES_FOLDER
@@ -13,9 +15,12 @@ template_env = Environment(
     autoescape=False,  # noqa: S701
     loader=FileSystemLoader(TEMPLATES_FOLDER),
     undefined=StrictUndefined,
+    # Templates ship with the package and do not change while running, so skip the per-lookup mtime check.
+    auto_reload=False,
 )
 
 
+@cache
 def get_template(name: str) -> Template:
     """Get a Jinja2 template."""
     return template_env.get_template(f"{name}.{_TEMPLATE_SUFFIX}")